@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Example: Douyin (TikTok China) coin earning on several devices at once.
+
+Runs one PhoneAgent per connected ADB device and drives them concurrently,
+so the whole batch takes as long as the slowest device instead of the sum
+of all devices.
+
+Usage:
+    python examples/douyin_multi_device.py          # all connected devices
+    python examples/douyin_multi_device.py --n 2    # first 2 devices only
+
+The model API key is read from PHONE_AGENT_API_KEY, as in main.py.
+"""
+
+import argparse
+import asyncio
+import os
+
+from phone_agent import PhoneAgent
+from phone_agent.adb import list_devices
+from phone_agent.agent import AgentConfig
+from phone_agent.model import ModelConfig
+from phone_agent.config.prompts_douyin_coins import get_douyin_coins_prompt
+
+TASK = "打开抖音极速版，浏览推荐视频流，每个视频观看至少3-5秒。同时完成赚金币任务，目标是获得至少100金币。"
+
+
+def make_agent(device_id: str) -> PhoneAgent:
+    """Create a Douyin coin earning agent bound to one device."""
+    model_config = ModelConfig(
+        base_url=os.getenv(
+            "PHONE_AGENT_BASE_URL", "https://open.bigmodel.cn/api/paas/v4"
+        ),
+        model_name=os.getenv("PHONE_AGENT_MODEL", "autoglm-Phone"),
+        api_key=os.getenv("PHONE_AGENT_API_KEY", "EMPTY"),
+        lang="cn"
+    )
+
+    agent_config = AgentConfig(
+        max_steps=150,
+        device_id=device_id,
+        verbose=True,
+        lang="cn",
+        auto_cleanup_screenshots=True,
+        system_prompt=get_douyin_coins_prompt()
+    )
+
+    return PhoneAgent(model_config=model_config, agent_config=agent_config)
+
+
+async def run_on_devices(device_ids: list[str]) -> None:
+    """Run the coin earning task on every device concurrently."""
+    agents = [make_agent(device_id) for device_id in device_ids]
+    results = await asyncio.gather(
+        *(agent.run_async(TASK) for agent in agents), return_exceptions=True
+    )
+
+    print("=" * 60)
+    for device_id, result in zip(device_ids, results):
+        if isinstance(result, Exception):
+            print(f"❌ {device_id}: 任务执行出错: {result}")
+        else:
+            print(f"✅ {device_id}: {result}")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Douyin coin earning on multiple devices")
+    parser.add_argument("--n", type=int, default=None, help="Number of devices to use")
+    args = parser.parse_args()
+
+    device_ids = [d.device_id for d in list_devices() if d.status == "device"]
+    if args.n is not None:
+        device_ids = device_ids[: args.n]
+
+    if not device_ids:
+        print("No devices connected.")
+    else:
+        print("=" * 60)
+        print(f"抖音极速版赚金币任务开始（{len(device_ids)} 台设备）")
+        print("=" * 60)
+        asyncio.run(run_on_devices(device_ids))
@@ -14,21 +14,181 @@ Environment Variables:
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import io
+import json
 import os
 import shutil
-import subprocess
 import sys
-from urllib.parse import urlparse
+import time
+from typing import TYPE_CHECKING
 
-from openai import OpenAI
-
-from phone_agent.agent_ios import IOSAgentConfig, IOSPhoneAgent
 from phone_agent.config.apps_ios import list_supported_apps
-from phone_agent.model import ModelConfig
-from phone_agent.xctest import XCTestConnection, list_devices
 
+# The agent, model client (openai) and xctest (PIL) modules are slow to import,
+# so they are imported where first needed to keep --help and --list-apps fast
+if TYPE_CHECKING:
+    from phone_agent.xctest import DeviceInfo, XCTestConnection
+
+
+READINESS_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "phone_agent", "ready.json"
+)
+READINESS_CACHE_TTL = 30.0  # seconds
+IDEVICE_ID_OK_KEY = "idevice_id_ok"
+IDEVICE_ID_OK_TTL = 24 * 3600.0  # seconds
+DEVICE_LIST_TTL = 10.0  # seconds
+HISTORY_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "phone_agent", "ios_history"
+)
+
+
+# Troubleshooting hints for failed system checks, joined once so each failing
+# check writes its hint in a single call
+_LIBIMOBILEDEVICE_MISSING_HINT = "\n".join(
+    [
+        "   Error: libimobiledevice is not installed or not in PATH.",
+        "   Solution: Install libimobiledevice:",
+        "     - macOS: brew install libimobiledevice",
+        "     - Linux: sudo apt-get install libimobiledevice-utils",
+    ]
+)
+_NO_DEVICES_HINT = "\n".join(
+    [
+        "   Error: No iOS devices connected.",
+        "   Solution:",
+        "     1. Connect your iOS device via USB",
+        "     2. Unlock the device and tap 'Trust This Computer'",
+        "     3. Verify connection: idevice_id -l",
+        "     4. Or connect via WiFi using device IP",
+    ]
+)
+_WDA_NOT_RUNNING_HINT = "\n".join(
+    [
+        "   Error: WebDriverAgent is not running or not accessible.",
+        "   Solution:",
+        "     1. Run WebDriverAgent on your iOS device via Xcode",
+        "     2. For USB: Set up port forwarding: iproxy 8100 8100",
+        "     3. For WiFi: Use device IP, e.g., --wda-url http://192.168.1.100:8100",
+        "     4. Verify in browser: open http://localhost:8100/status",
+        "",
+        "   Quick setup guide:",
+        "     git clone https://github.com/appium/WebDriverAgent.git && cd WebDriverAgent",
+        "     ./Scripts/bootstrap.sh",
+        "     open WebDriverAgent.xcodeproj",
+        "     # Configure signing, then Product > Test (Cmd+U)",
+    ]
+)
+
+_START_WDA_HINT = "\n".join(
+    [
+        "\nPlease start WebDriverAgent on your iOS device:",
+        "  1. Open WebDriverAgent.xcodeproj in Xcode",
+        "  2. Select your device",
+        "  3. Run WebDriverAgentRunner (Product > Test or Cmd+U)",
+        "  4. For USB: Run port forwarding: iproxy 8100 8100",
+    ]
+)
+
+
+def _readiness_key(wda_url: str, device_id: str | None) -> str:
+    """Build the readiness cache key for a WDA URL and device."""
+    return hashlib.sha1(f"{wda_url}|{device_id or ''}".encode("utf-8")).hexdigest()
+
+
+def _read_readiness_entries() -> dict[str, float]:
+    """Read all readiness cache entries, ignoring a missing or corrupt file."""
+    try:
+        with open(READINESS_CACHE_PATH, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        return entries if isinstance(entries, dict) else {}
+    except (OSError, ValueError):
+        return {}
 
-def check_system_requirements(wda_url: str = "http://localhost:8100") -> bool:
+
+def _load_readiness_cache(
+    key: str, ttl: float = READINESS_CACHE_TTL
+) -> float | None:
+    """
+    Look up a cached positive check result.
+
+    Args:
+        key: Cache key.
+        ttl: Maximum age of the entry in seconds.
+
+    Returns:
+        Timestamp of the cached result, or None if missing or expired.
+    """
+    timestamp = _read_readiness_entries().get(key)
+    if isinstance(timestamp, (int, float)) and time.time() - timestamp < ttl:
+        return timestamp
+    return None
+
+
+def _save_readiness_cache(key: str) -> None:
+    """Record a positive check result for key. Failures are ignored."""
+    entries = _read_readiness_entries()
+    entries[key] = time.time()
+    try:
+        os.makedirs(os.path.dirname(READINESS_CACHE_PATH), exist_ok=True)
+        with open(READINESS_CACHE_PATH, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+    except OSError:
+        pass
+
+
+def _clear_readiness_cache() -> None:
+    """Drop all cached check results."""
+    try:
+        os.remove(READINESS_CACHE_PATH)
+    except OSError:
+        pass
+
+
+# (monotonic time, devices) of the last device listing
+_device_list: tuple[float, tuple["DeviceInfo", ...]] | None = None
+
+
+def _list_devices_cached(
+    ttl: float = DEVICE_LIST_TTL,
+) -> tuple["DeviceInfo", ...]:
+    """
+    List connected iOS devices, reusing a listing younger than ttl seconds.
+
+    Startup checks and the header ask for devices back to back, so this saves
+    repeated idevice_id forks without hiding devices plugged in later.
+    """
+    global _device_list
+    now = time.monotonic()
+    if _device_list is not None and now - _device_list[0] < ttl:
+        return _device_list[1]
+
+    from phone_agent.xctest.connection import list_devices
+
+    devices = tuple(list_devices())
+    _device_list = (now, devices)
+    return devices
+
+
+def _clear_device_list_cache() -> None:
+    """Drop the cached device listing."""
+    global _device_list
+    _device_list = None
+
+
+@functools.lru_cache(maxsize=None)
+def get_wda_conn(wda_url: str) -> "XCTestConnection":
+    """Get the shared XCTestConnection for a WebDriverAgent URL."""
+    from phone_agent.xctest.connection import XCTestConnection
+
+    return XCTestConnection(wda_url=wda_url)
+
+
+async def check_system_requirements_async(
+    wda_url: str = "http://localhost:8100",
+) -> bool:
     """
     Check system requirements before running the agent.
 
@@ -37,12 +197,58 @@ def check_system_requirements(wda_url: str = "http://localhost:8100") -> bool:
     2. At least one iOS device connected
     3. WebDriverAgent is running
 
+    The three probes only wait on subprocesses or sockets, so they run
+    concurrently; results are reported in order once all have completed.
+
     Args:
         wda_url: WebDriverAgent URL to check.
 
     Returns:
         True if all checks pass, False otherwise.
     """
+    loop = asyncio.get_running_loop()
+
+    async def check_libimobile() -> str:
+        if shutil.which("idevice_id") is None:
+            return "missing"
+        # Double check by running idevice_id, at most once a day
+        if _load_readiness_cache(IDEVICE_ID_OK_KEY, ttl=IDEVICE_ID_OK_TTL):
+            return "ok"
+        proc = await asyncio.create_subprocess_exec(
+            "idevice_id",
+            "-ln",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
+        )
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=10)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            return "timeout"
+        if proc.returncode != 0:
+            return "failed"
+        _save_readiness_cache(IDEVICE_ID_OK_KEY)
+        return "ok"
+
+    async def check_devices() -> list:
+        if shutil.which("idevice_id") is None:
+            return []
+        return await loop.run_in_executor(None, _list_devices_cached)
+
+    def probe_wda() -> tuple[bool, dict | None]:
+        conn = get_wda_conn(wda_url)
+        if not conn.is_wda_ready():
+            return False, None
+        return True, conn.get_wda_status()
+
+    async def check_wda() -> tuple[bool, dict | None]:
+        return await loop.run_in_executor(None, probe_wda)
+
+    libimobile, devices, wda = await asyncio.gather(
+        check_libimobile(), check_devices(), check_wda(), return_exceptions=True
+    )
+
     print("🔍 Checking system requirements...")
     print("-" * 50)
 
@@ -50,33 +256,24 @@ def check_system_requirements(wda_url: str = "http://localhost:8100") -> bool:
 
     # Check 1: libimobiledevice installed
     print("1. Checking libimobiledevice installation...", end=" ")
-    if shutil.which("idevice_id") is None:
+    if libimobile == "ok":
+        print("✅ OK")
+    elif libimobile == "missing":
         print("❌ FAILED")
-        print("   Error: libimobiledevice is not installed or not in PATH.")
-        print("   Solution: Install libimobiledevice:")
-        print("     - macOS: brew install libimobiledevice")
-        print("     - Linux: sudo apt-get install libimobiledevice-utils")
+        print(_LIBIMOBILEDEVICE_MISSING_HINT)
+        all_passed = False
+    elif libimobile == "timeout":
+        print("❌ FAILED")
+        print("   Error: idevice_id command timed out.")
+        all_passed = False
+    elif isinstance(libimobile, FileNotFoundError):
+        print("❌ FAILED")
+        print("   Error: idevice_id command not found.")
         all_passed = False
     else:
-        # Double check by running idevice_id
-        try:
-            result = subprocess.run(
-                ["idevice_id", "-ln"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                print("✅ OK")
-            else:
-                print("❌ FAILED")
-                print("   Error: idevice_id command failed to run.")
-                all_passed = False
-        except FileNotFoundError:
-            print("❌ FAILED")
-            print("   Error: idevice_id command not found.")
-            all_passed = False
-        except subprocess.TimeoutExpired:
-            print("❌ FAILED")
-            print("   Error: idevice_id command timed out.")
-            all_passed = False
+        print("❌ FAILED")
+        print("   Error: idevice_id command failed to run.")
+        all_passed = False
 
     # If libimobiledevice is not installed, skip remaining checks
     if not all_passed:
@@ -86,27 +283,17 @@ def check_system_requirements(wda_url: str = "http://localhost:8100") -> bool:
 
     # Check 2: iOS Device connected
     print("2. Checking connected iOS devices...", end=" ")
-    try:
-        devices = list_devices()
-
-        if not devices:
-            print("❌ FAILED")
-            print("   Error: No iOS devices connected.")
-            print("   Solution:")
-            print("     1. Connect your iOS device via USB")
-            print("     2. Unlock the device and tap 'Trust This Computer'")
-            print("     3. Verify connection: idevice_id -l")
-            print("     4. Or connect via WiFi using device IP")
-            all_passed = False
-        else:
-            device_names = [
-                d.device_name or d.device_id[:8] + "..." for d in devices
-            ]
-            print(f"✅ OK ({len(devices)} device(s): {', '.join(device_names)})")
-    except Exception as e:
+    if isinstance(devices, Exception):
+        print("❌ FAILED")
+        print(f"   Error: {devices}")
+        all_passed = False
+    elif not devices:
         print("❌ FAILED")
-        print(f"   Error: {e}")
+        print(_NO_DEVICES_HINT)
         all_passed = False
+    else:
+        device_names = [d.device_name or d.device_id[:8] + "..." for d in devices]
+        print(f"✅ OK ({len(devices)} device(s): {', '.join(device_names)})")
 
     # If no device connected, skip WebDriverAgent check
     if not all_passed:
@@ -116,38 +303,22 @@ def check_system_requirements(wda_url: str = "http://localhost:8100") -> bool:
 
     # Check 3: WebDriverAgent running
     print(f"3. Checking WebDriverAgent ({wda_url})...", end=" ")
-    try:
-        conn = XCTestConnection(wda_url=wda_url)
-
-        if conn.is_wda_ready():
+    if isinstance(wda, Exception):
+        print("❌ FAILED")
+        print(f"   Error: {wda}")
+        all_passed = False
+    else:
+        wda_ready, status = wda
+        if wda_ready:
             print("✅ OK")
             # Get WDA status for additional info
-            status = conn.get_wda_status()
             if status:
                 session_id = status.get("sessionId", "N/A")
                 print(f"   Session ID: {session_id}")
         else:
             print("❌ FAILED")
-            print("   Error: WebDriverAgent is not running or not accessible.")
-            print("   Solution:")
-            print("     1. Run WebDriverAgent on your iOS device via Xcode")
-            print("     2. For USB: Set up port forwarding: iproxy 8100 8100")
-            print(
-                "     3. For WiFi: Use device IP, e.g., --wda-url http://192.168.1.100:8100"
-            )
-            print("     4. Verify in browser: open http://localhost:8100/status")
-            print("\n   Quick setup guide:")
-            print(
-                "     git clone https://github.com/appium/WebDriverAgent.git && cd WebDriverAgent"
-            )
-            print("     ./Scripts/bootstrap.sh")
-            print("     open WebDriverAgent.xcodeproj")
-            print("     # Configure signing, then Product > Test (Cmd+U)")
+            print(_WDA_NOT_RUNNING_HINT)
             all_passed = False
-    except Exception as e:
-        print("❌ FAILED")
-        print(f"   Error: {e}")
-        all_passed = False
 
     print("-" * 50)
 
@@ -159,21 +330,47 @@ def check_system_requirements(wda_url: str = "http://localhost:8100") -> bool:
     return all_passed
 
 
-def check_model_api(base_url: str, api_key: str, model_name: str) -> bool:
+def check_system_requirements(wda_url: str = "http://localhost:8100") -> bool:
     """
-    Check if the model API is accessible and the specified model exists.
-
-    Checks:
-    1. Network connectivity to the API endpoint
-    2. Model exists in the available models list
+    Synchronous wrapper around check_system_requirements_async.
 
     Args:
-        base_url: The API base URL
-        model_name: The model name to check
+        wda_url: WebDriverAgent URL to check.
 
     Returns:
         True if all checks pass, False otherwise.
     """
+    return asyncio.run(check_system_requirements_async(wda_url=wda_url))
+
+
+async def _probe_model_api(
+    base_url: str, api_key: str
+) -> tuple[list[str] | None, Exception | None]:
+    """
+    List the models served at base_url.
+
+    Returns:
+        Tuple of (available model ids, error). Exactly one of them is None.
+    """
+    from openai import AsyncOpenAI
+
+    client = AsyncOpenAI(base_url=base_url, api_key=api_key, timeout=10.0)
+    try:
+        models_response = await client.models.list()
+        return [model.id for model in models_response.data], None
+    except Exception as e:
+        return None, e
+    finally:
+        await client.close()
+
+
+def _report_model_api(
+    base_url: str,
+    model_name: str,
+    available_models: list[str] | None,
+    error: Exception | None,
+) -> bool:
+    """Print the model API check results and return whether they passed."""
     print("🔍 Checking model API...")
     print("-" * 50)
 
@@ -181,17 +378,7 @@ def check_model_api(base_url: str, api_key: str, model_name: str) -> bool:
 
     # Check 1: Network connectivity
     print(f"1. Checking API connectivity ({base_url})...", end=" ")
-    try:
-        # Parse the URL to get host and port
-        parsed = urlparse(base_url)
-
-        # Create OpenAI client
-        client = OpenAI(base_url=base_url, api_key=api_key, timeout=10.0)
-
-        # Try to list models (this tests connectivity)
-        models_response = client.models.list()
-        available_models = [model.id for model in models_response.data]
-
+    if error is None:
         print("✅ OK")
 
         # Check 2: Model exists
@@ -208,9 +395,9 @@ def check_model_api(base_url: str, api_key: str, model_name: str) -> bool:
                 print(f"     ... and {len(available_models) - 10} more")
             all_passed = False
 
-    except Exception as e:
+    else:
         print("❌ FAILED")
-        error_msg = str(e)
+        error_msg = str(error)
 
         # Provide more specific error messages
         if "Connection refused" in error_msg or "Connection error" in error_msg:
@@ -247,6 +434,36 @@ def check_model_api(base_url: str, api_key: str, model_name: str) -> bool:
     return all_passed
 
 
+async def check_model_api_async(base_url: str, api_key: str, model_name: str) -> bool:
+    """
+    Check if the model API is accessible and the specified model exists.
+
+    Checks:
+    1. Network connectivity to the API endpoint
+    2. Model exists in the available models list
+
+    Args:
+        base_url: The API base URL
+        api_key: The API key for authentication
+        model_name: The model name to check
+
+    Returns:
+        True if all checks pass, False otherwise.
+    """
+    available_models, error = await _probe_model_api(base_url, api_key)
+    return _report_model_api(base_url, model_name, available_models, error)
+
+
+def check_model_api(base_url: str, api_key: str, model_name: str) -> bool:
+    """
+    Synchronous wrapper around check_model_api_async.
+
+    Returns:
+        True if all checks pass, False otherwise.
+    """
+    return asyncio.run(check_model_api_async(base_url, api_key, model_name))
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -275,6 +492,9 @@ Examples:
     # List supported apps
     python ios.py --list-apps
 
+    # Re-run system checks even if a recent run passed them
+    python ios.py --force-check
+
     # Run a specific task
     python ios.py "Open Safari and search for iPhone tips"
         """,
@@ -350,6 +570,12 @@ Examples:
         "--list-apps", action="store_true", help="List supported apps and exit"
     )
 
+    parser.add_argument(
+        "--force-check",
+        action="store_true",
+        help="Run system checks even if a recent run passed them",
+    )
+
     parser.add_argument(
         "--lang",
         type=str,
@@ -368,6 +594,16 @@ Examples:
     return parser.parse_args()
 
 
+async def _probe_wda_status(conn: "XCTestConnection") -> tuple[bool, dict | None]:
+    """Run the WDA readiness and status requests concurrently."""
+    loop = asyncio.get_running_loop()
+    ready, status = await asyncio.gather(
+        loop.run_in_executor(None, conn.is_wda_ready),
+        loop.run_in_executor(None, conn.get_wda_status),
+    )
+    return ready, status
+
+
 def handle_device_commands(args) -> bool:
     """
     Handle iOS device-related commands.
@@ -375,11 +611,15 @@ def handle_device_commands(args) -> bool:
     Returns:
         True if a device command was handled (should exit), False otherwise.
     """
-    conn = XCTestConnection(wda_url=args.wda_url)
+    conn = get_wda_conn(args.wda_url)
+
+    # Device state may have changed, so drop cached check results
+    if args.list_devices or args.pair:
+        _clear_readiness_cache()
 
     # Handle --list-devices
     if args.list_devices:
-        devices = list_devices()
+        devices = _list_devices_cached()
         if not devices:
             print("No iOS devices connected.")
             print("\nTroubleshooting:")
@@ -387,26 +627,32 @@ def handle_device_commands(args) -> bool:
             print("  2. Unlock device and trust this computer")
             print("  3. Run: idevice_id -l")
         else:
-            print("Connected iOS devices:")
-            print("-" * 70)
+            separator = "-" * 70
+            buf = io.StringIO()
+            buf.write(f"Connected iOS devices:\n{separator}\n")
             for device in devices:
                 conn_type = device.connection_type.value
                 model_info = f"{device.model}" if device.model else "Unknown"
                 ios_info = f"iOS {device.ios_version}" if device.ios_version else ""
                 name_info = device.device_name or "Unnamed"
 
-                print(f"  ✓ {name_info}")
-                print(f"    UDID: {device.device_id}")
-                print(f"    Model: {model_info}")
-                print(f"    OS: {ios_info}")
-                print(f"    Connection: {conn_type}")
-                print("-" * 70)
+                buf.write(
+                    f"  ✓ {name_info}\n"
+                    f"    UDID: {device.device_id}\n"
+                    f"    Model: {model_info}\n"
+                    f"    OS: {ios_info}\n"
+                    f"    Connection: {conn_type}\n"
+                    f"{separator}\n"
+                )
+            sys.stdout.write(buf.getvalue())
         return True
 
     # Handle --pair
     if args.pair:
         print("Pairing with iOS device...")
         success, message = conn.pair_device(args.device_id)
+        if success:
+            _clear_device_list_cache()
         print(f"{'✓' if success else '✗'} {message}")
         return True
 
@@ -415,28 +661,31 @@ def handle_device_commands(args) -> bool:
         print(f"Checking WebDriverAgent status at {args.wda_url}...")
         print("-" * 50)
 
-        if conn.is_wda_ready():
+        wda_ready, status = asyncio.run(_probe_wda_status(conn))
+
+        if wda_ready:
             print("✓ WebDriverAgent is running")
 
-            status = conn.get_wda_status()
             if status:
-                print(f"\nStatus details:")
                 value = status.get("value", {})
-                print(f"  Session ID: {status.get('sessionId', 'N/A')}")
-                print(f"  Build: {value.get('build', {}).get('time', 'N/A')}")
+                buf = io.StringIO()
+                buf.write(
+                    "\nStatus details:\n"
+                    f"  Session ID: {status.get('sessionId', 'N/A')}\n"
+                    f"  Build: {value.get('build', {}).get('time', 'N/A')}\n"
+                )
 
                 current_app = value.get("currentApp", {})
                 if current_app:
-                    print(f"\nCurrent App:")
-                    print(f"  Bundle ID: {current_app.get('bundleId', 'N/A')}")
-                    print(f"  Process ID: {current_app.get('pid', 'N/A')}")
+                    buf.write(
+                        "\nCurrent App:\n"
+                        f"  Bundle ID: {current_app.get('bundleId', 'N/A')}\n"
+                        f"  Process ID: {current_app.get('pid', 'N/A')}\n"
+                    )
+                sys.stdout.write(buf.getvalue())
         else:
             print("✗ WebDriverAgent is not running")
-            print("\nPlease start WebDriverAgent on your iOS device:")
-            print("  1. Open WebDriverAgent.xcodeproj in Xcode")
-            print("  2. Select your device")
-            print("  3. Run WebDriverAgentRunner (Product > Test or Cmd+U)")
-            print(f"  4. For USB: Run port forwarding: iproxy 8100 8100")
+            print(_START_WDA_HINT)
 
         return True
 
@@ -464,14 +713,22 @@ def main():
     if handle_device_commands(args):
         return
 
-    # Run system requirements check before proceeding
-    if not check_system_requirements(wda_url=args.wda_url):
+    # Run system requirements check before proceeding, unless a recent run passed
+    readiness_key = _readiness_key(args.wda_url, args.device_id)
+    if not args.force_check and _load_readiness_cache(readiness_key) is not None:
+        print("✅ System checks passed (cached)\n")
+    elif check_system_requirements(wda_url=args.wda_url):
+        _save_readiness_cache(readiness_key)
+    else:
         sys.exit(1)
 
     # Check model API connectivity and model availability
     # if not check_model_api(args.base_url, args.api_key, args.model):
     #     sys.exit(1)
 
+    from phone_agent.agent_ios import IOSAgentConfig, IOSPhoneAgent
+    from phone_agent.model import ModelConfig
+
     # Create configurations
     model_config = ModelConfig(
         base_url=args.base_url,
@@ -491,6 +748,7 @@ def main():
     agent = IOSPhoneAgent(
         model_config=model_config,
         agent_config=agent_config,
+        wda_connection=get_wda_conn(args.wda_url),
     )
 
     # Print header
@@ -504,7 +762,7 @@ def main():
     print(f"Language: {agent_config.lang}")
 
     # Show device info
-    devices = list_devices()
+    devices = _list_devices_cached()
     if agent_config.device_id:
         print(f"Device: {agent_config.device_id}")
     elif devices:
@@ -523,28 +781,11 @@ def main():
         # Interactive mode
         print("\nEntering interactive mode. Type 'quit' to exit.\n")
 
-        while True:
-            try:
-                task = input("Enter your task: ").strip()
-
-                if task.lower() in ("quit", "exit", "q"):
-                    print("Goodbye!")
-                    break
-
-                if not task:
-                    continue
-
-                print()
-                result = agent.run(task)
-                print(f"\nResult: {result}\n")
-                agent.reset()
-
-            except KeyboardInterrupt:
-                print("\n\nInterrupted. Goodbye!")
-                break
-            except Exception as e:
-                print(f"\nError: {e}\n")
+        from phone_agent.interactive import run_interactive
 
+        run_interactive(
+            agent, HISTORY_PATH, on_error=lambda e: _clear_readiness_cache()
+        )
 
 if __name__ == "__main__":
     main()
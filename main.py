@@ -14,28 +14,431 @@ Environment Variables:
 """
 
 import argparse
+import asyncio
+import functools
+import hashlib
+import json
 import os
+import re
 import shutil
 import subprocess
 import sys
-from urllib.parse import urlparse
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, NamedTuple
 
-from openai import OpenAI
-
-from phone_agent import PhoneAgent
-from phone_agent.agent import AgentConfig
-from phone_agent.agent_ios import IOSAgentConfig, IOSPhoneAgent
 from phone_agent.config.apps import list_supported_apps
 from phone_agent.config.apps_harmonyos import list_supported_apps as list_harmonyos_apps
 from phone_agent.config.apps_ios import list_supported_apps as list_ios_apps
 from phone_agent.device_factory import DeviceType, get_device_factory, set_device_type
-from phone_agent.model import ModelConfig
-from phone_agent.xctest import XCTestConnection
-from phone_agent.xctest import list_devices as list_ios_devices
+
+# The agents, model client (openai) and xctest (PIL, requests) modules are slow
+# to import, so they are imported where first needed to keep --help,
+# --list-apps and the device commands fast
+if TYPE_CHECKING:
+    from phone_agent.xctest import DeviceInfo
+
+READINESS_CACHE_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "phone_agent", "readiness.json"
+)
+READINESS_CACHE_TTL = 30.0  # seconds
+DEVICE_SNAPSHOT_TTL = 2.0  # seconds
+MODEL_LATENCY_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "phone_agent", "model_latency.json"
+)
+MODEL_LATENCY_SAMPLES = 20
+MODEL_PROBE_TIMEOUT = 2.0  # seconds, first attempt when there is no history
+MODEL_PROBE_MIN_TIMEOUT = 1.0  # seconds
+HISTORY_PATH = os.path.join(os.path.expanduser("~"), ".cache", "phone_agent", "history")
+
+class _DeviceProfile(NamedTuple):
+    """Per-device-type tool details used by the system check."""
+
+    tool_name: str
+    tool_cmd: str
+    version_args: tuple[str, ...]
+    install_hint: tuple[str, ...]
+    no_devices_hint: tuple[str, ...]
+
+
+_DEVICE_PROFILES: dict[DeviceType, _DeviceProfile] = {
+    DeviceType.ADB: _DeviceProfile(
+        tool_name="ADB",
+        tool_cmd="adb",
+        version_args=("version",),
+        install_hint=(
+            "     - macOS: brew install android-platform-tools",
+            "     - Linux: sudo apt install android-tools-adb",
+            "     - Windows: Download from https://developer.android.com/studio/releases/platform-tools",
+        ),
+        no_devices_hint=(
+            "     1. Enable USB debugging on your Android device",
+            "     2. Connect via USB and authorize the connection",
+            "     3. Or connect remotely: python main.py --connect <ip>:<port>",
+        ),
+    ),
+    DeviceType.HDC: _DeviceProfile(
+        tool_name="HDC",
+        tool_cmd="hdc",
+        version_args=("-v",),
+        install_hint=(
+            "     - Download from HarmonyOS SDK or https://gitee.com/openharmony/docs",
+            "     - Add to PATH environment variable",
+        ),
+        no_devices_hint=(
+            "     1. Enable USB debugging on your HarmonyOS device",
+            "     2. Connect via USB and authorize the connection",
+            "     3. Or connect remotely: python main.py --device-type hdc --connect <ip>:<port>",
+        ),
+    ),
+    DeviceType.IOS: _DeviceProfile(
+        tool_name="libimobiledevice",
+        tool_cmd="idevice_id",
+        version_args=("-ln",),
+        install_hint=(
+            "     - macOS: brew install libimobiledevice",
+            "     - Linux: sudo apt-get install libimobiledevice-utils",
+        ),
+        no_devices_hint=(
+            "     1. Connect your iOS device via USB",
+            "     2. Unlock device and tap 'Trust This Computer'",
+            "     3. Verify: idevice_id -l",
+            "     4. Or connect via WiFi using device IP",
+        ),
+    ),
+}
+
+# Device IDs found by the startup check, by device type, as (monotonic time, ids)
+_device_snapshots: dict[DeviceType, tuple[float, list[str]]] = {}
+
+# Device lines in `adb devices` output, and ADB Keyboard in `ime list -s` output
+_ADB_DEVICE_LINE_RE = re.compile(rb"^(\S+)\tdevice\b", re.M)
+_ADB_KEYBOARD_IME_RE = re.compile(rb"^com\.android\.adbkeyboard/\.AdbIME", re.M)
+
+# iPhone/iPad entries in `system_profiler SPUSBDataType` output (macOS only)
+_USB_IOS_SERIAL_RE = re.compile(rb"(?:iPhone|iPad):.*?Serial Number: (\S+)", re.S)
+
+# Upper bound on the stdout kept from a check command
+CHECK_OUTPUT_CAP = 64 * 1024  # bytes
+
+
+def _readiness_key(*parts: str | None) -> str:
+    """Build a readiness cache key from the parameters a check depends on."""
+    raw = "|".join(part or "" for part in parts)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+def _read_readiness_entries() -> dict[str, dict]:
+    """Read all readiness cache entries, ignoring a missing or corrupt file."""
+    try:
+        with open(READINESS_CACHE_PATH, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+        return entries if isinstance(entries, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _is_ready_cached(key: str, ttl: float = READINESS_CACHE_TTL) -> bool:
+    """Return True if a check with this key passed within the last ttl seconds."""
+    entry = _read_readiness_entries().get(key)
+    if not isinstance(entry, dict) or not entry.get("ok"):
+        return False
+    timestamp = entry.get("ts")
+    return isinstance(timestamp, (int, float)) and time.time() - timestamp < ttl
+
+
+def _save_readiness(key: str) -> None:
+    """Record a passed check for key. Only successes are cached; errors are ignored."""
+    entries = _read_readiness_entries()
+    entries[key] = {"ok": True, "ts": time.time()}
+    tmp_path = f"{READINESS_CACHE_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(READINESS_CACHE_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(tmp_path, READINESS_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _run_capped(
+    cmd: list[str], timeout: float = 10, cap: int = CHECK_OUTPUT_CAP
+) -> tuple[int, bytes]:
+    """
+    Run a command and read at most cap bytes of its raw stdout.
+
+    A command that is still writing once cap bytes have been read is killed,
+    so its return code is nonzero. stderr is discarded.
+
+    Args:
+        cmd: Command and arguments.
+        timeout: Seconds before the command is killed.
+        cap: Maximum number of stdout bytes to keep.
+
+    Returns:
+        Tuple of (return code, stdout bytes).
+
+    Raises:
+        FileNotFoundError: If the command does not exist.
+        subprocess.TimeoutExpired: If the command did not finish in time.
+    """
+    proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    timed_out = threading.Event()
+
+    def kill_on_timeout() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout, kill_on_timeout)
+    timer.start()
+    try:
+        with proc.stdout:
+            output = proc.stdout.read(cap)
+            if proc.stdout.read(1):
+                proc.kill()
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout, output=output)
+    return returncode, output
+
+
+@functools.cache
+def _which(cmd: str) -> str | None:
+    """shutil.which, memoized for the run: each tool's PATH lookup is done once."""
+    return shutil.which(cmd)
+
+
+def _connected_device_ids(device_type: DeviceType) -> list[str]:
+    """
+    Get connected ADB/HDC device IDs, reusing the startup check's listing.
+
+    The listing is reused if it is younger than DEVICE_SNAPSHOT_TTL seconds;
+    otherwise the device factory is asked again.
+    """
+    snapshot = _device_snapshots.get(device_type)
+    if snapshot is not None and time.monotonic() - snapshot[0] < DEVICE_SNAPSHOT_TTL:
+        return snapshot[1]
+    return [device.device_id for device in get_device_factory().list_devices()]
+
+
+def _usb_ios_serials() -> set[str] | None:
+    """
+    Get the serial numbers of iOS devices attached over USB, on macOS.
+
+    Returns:
+        Upper-cased serials with dashes removed, or None if unavailable.
+    """
+    if sys.platform != "darwin":
+        return None
+    try:
+        # The USB tree can be large; a truncated listing is not trusted
+        returncode, output = _run_capped(
+            ["system_profiler", "SPUSBDataType"], cap=16 * CHECK_OUTPUT_CAP
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if returncode != 0:
+        return None
+    return {
+        serial.decode("ascii", "replace").replace("-", "").upper()
+        for serial in _USB_IOS_SERIAL_RE.findall(output)
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_ios_devices() -> tuple["DeviceInfo", ...]:
+    """
+    List iOS devices once per process, without duplicate or ghost entries.
+
+    libimobiledevice can report the same UDID twice or keep listing a USB
+    device that has been unplugged. Duplicates are dropped, and on macOS
+    USB entries are cross-checked against system_profiler. The cross-check
+    is skipped if system_profiler finds no devices at all.
+    """
+    if _which("idevice_id") is None:
+        return ()
+
+    from phone_agent.xctest import ConnectionType
+    from phone_agent.xctest import list_devices as list_ios_devices
+
+    devices: dict[str, "DeviceInfo"] = {}
+    for device in list_ios_devices():
+        devices.setdefault(device.device_id, device)
+
+    usb_serials = _usb_ios_serials()
+    if usb_serials:
+        devices = {
+            udid: device
+            for udid, device in devices.items()
+            if device.connection_type != ConnectionType.USB
+            or udid.replace("-", "").upper() in usb_serials
+        }
+    return tuple(devices.values())
+
+
+def _check_tool_installed(device_type: DeviceType) -> tuple[bool, list[str]]:
+    """
+    Check that the device tool is installed and runs.
+
+    Returns:
+        Tuple of (passed, output lines); the first line is the status.
+    """
+    profile = _DEVICE_PROFILES[device_type]
+    tool_name = profile.tool_name
+
+    if _which(profile.tool_cmd) is None:
+        return False, [
+            "❌ FAILED",
+            f"   Error: {tool_name} is not installed or not in PATH.",
+            f"   Solution: Install {tool_name}:",
+            *profile.install_hint,
+        ]
+
+    # Double check by running version command
+    try:
+        returncode, output = _run_capped([profile.tool_cmd, *profile.version_args])
+        if returncode == 0:
+            # Tool output is plain ASCII; only the first line is decoded
+            version_line = output.strip().partition(b"\n")[0].rstrip()
+            version_line = version_line.decode("ascii", "replace")
+            return True, [f"✅ OK ({version_line if version_line else 'installed'})"]
+        return False, ["❌ FAILED", f"   Error: {tool_name} command failed to run."]
+    except FileNotFoundError:
+        return False, ["❌ FAILED", f"   Error: {tool_name} command not found."]
+    except subprocess.TimeoutExpired:
+        return False, ["❌ FAILED", f"   Error: {tool_name} command timed out."]
+
+
+def _check_devices_connected(
+    device_type: DeviceType, wait_timeout: float = 5.0
+) -> tuple[bool, list[str]]:
+    """
+    Check that at least one device is connected.
+
+    For ADB, first blocks in `adb wait-for-device` for up to wait_timeout
+    seconds so a device that is still booting or was just plugged in is
+    picked up instead of failing straight away.
+
+    Returns:
+        Tuple of (passed, output lines); the first line is the status.
+    """
+    try:
+        if device_type == DeviceType.ADB:
+            try:
+                subprocess.run(
+                    ["adb", "wait-for-device"],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=wait_timeout,
+                )
+            except subprocess.TimeoutExpired:
+                pass  # Reported below as "no devices connected"
+            _, output = _run_capped(["adb", "devices"])
+            # Only devices in 'device' state; the header line has no tab
+            device_ids = [
+                device_id.decode("ascii", "replace")
+                for device_id in _ADB_DEVICE_LINE_RE.findall(output)
+            ]
+        elif device_type == DeviceType.HDC:
+            _, output = _run_capped(["hdc", "list", "targets"])
+            device_ids = [
+                line.strip().decode("ascii", "replace")
+                for line in output.splitlines()
+                if line.strip()
+            ]
+        else:  # IOS
+            device_ids = [d.device_id for d in _cached_ios_devices()]
+
+        if device_type != DeviceType.IOS:
+            _device_snapshots[device_type] = (time.monotonic(), device_ids)
+
+        if not device_ids:
+            return False, [
+                "❌ FAILED",
+                "   Error: No devices connected.",
+                "   Solution:",
+                *_DEVICE_PROFILES[device_type].no_devices_hint,
+            ]
+
+        return True, [
+            f"✅ OK ({len(device_ids)} device(s): {', '.join(device_ids[:2])}{'...' if len(device_ids) > 2 else ''})"
+        ]
+    except subprocess.TimeoutExpired:
+        tool_name = _DEVICE_PROFILES[device_type].tool_name
+        return False, ["❌ FAILED", f"   Error: {tool_name} command timed out."]
+    except Exception as e:
+        return False, ["❌ FAILED", f"   Error: {e}"]
+
+
+def _check_adb_keyboard() -> tuple[bool, list[str]]:
+    """
+    Check that ADB Keyboard is installed on the device.
+
+    Only runs once the device check has passed, so the device is online.
+
+    Returns:
+        Tuple of (passed, output lines); the first line is the status.
+    """
+    try:
+        _, output = _run_capped(["adb", "shell", "ime", "list", "-s"])
+        if _ADB_KEYBOARD_IME_RE.search(output):
+            return True, ["✅ OK"]
+        return False, [
+            "❌ FAILED",
+            "   Error: ADB Keyboard is not installed on the device.",
+            "   Solution:",
+            "     1. Download ADB Keyboard APK from:",
+            "        https://github.com/senzhk/ADBKeyBoard/blob/master/ADBKeyboard.apk",
+            "     2. Install it on your device: adb install ADBKeyboard.apk",
+            "     3. Enable it in Settings > System > Languages & Input > Virtual Keyboard",
+        ]
+    except subprocess.TimeoutExpired:
+        return False, ["❌ FAILED", "   Error: ADB command timed out."]
+    except Exception as e:
+        return False, ["❌ FAILED", f"   Error: {e}"]
+
+
+def _check_wda(wda_url: str) -> tuple[bool, list[str]]:
+    """
+    Check that WebDriverAgent is running.
+
+    Returns:
+        Tuple of (passed, output lines); the first line is the status.
+    """
+    from phone_agent.xctest import XCTestConnection
+
+    try:
+        conn = XCTestConnection(wda_url=wda_url)
+
+        if conn.is_wda_ready():
+            output = ["✅ OK"]
+            # Get WDA status for additional info
+            status = conn.get_wda_status()
+            if status:
+                session_id = status.get("sessionId", "N/A")
+                output.append(f"   Session ID: {session_id}")
+            return True, output
+        return False, [
+            "❌ FAILED",
+            "   Error: WebDriverAgent is not running or not accessible.",
+            "   Solution:",
+            "     1. Run WebDriverAgent on your iOS device via Xcode",
+            "     2. For USB: Set up port forwarding: iproxy 8100 8100",
+            "     3. For WiFi: Use device IP, e.g., --wda-url http://192.168.1.100:8100",
+            "     4. Verify in browser: open http://localhost:8100/status",
+        ]
+    except Exception as e:
+        return False, ["❌ FAILED", f"   Error: {e}"]
 
 
 def check_system_requirements(
-    device_type: DeviceType = DeviceType.ADB, wda_url: str = "http://localhost:8100"
+    device_type: DeviceType = DeviceType.ADB,
+    wda_url: str = "http://localhost:8100",
+    wait_timeout: float = 5.0,
 ) -> bool:
     """
     Check system requirements before running the agent.
@@ -46,9 +449,15 @@ def check_system_requirements(
     3. ADB Keyboard installed on the device (for ADB only)
     4. WebDriverAgent running (for iOS only)
 
+    The probes are I/O-bound and run concurrently on a thread pool; results
+    are printed in order, and the checks after a failed one are reported as
+    skipped. The ADB Keyboard probe needs a device, so it only starts once
+    the device check has passed.
+
     Args:
         device_type: Type of device tool (ADB, HDC, or IOS).
         wda_url: WebDriverAgent URL (for iOS only).
+        wait_timeout: Seconds to wait for an ADB device to come online.
 
     Returns:
         True if all checks pass, False otherwise.
@@ -56,266 +465,298 @@ def check_system_requirements(
     print("🔍 Checking system requirements...")
     print("-" * 50)
 
-    all_passed = True
+    profile = _DEVICE_PROFILES[device_type]
+
+    # Each check depends on the one before it: once a check fails, the rest
+    # are reported as skipped rather than run. Speculative checks start right
+    # away; the others wait until every check before them has passed.
+    checks = [
+        (
+            f"1. Checking {profile.tool_name} installation...",
+            _check_tool_installed,
+            (device_type,),
+            True,
+        ),
+        (
+            "2. Checking connected devices...",
+            _check_devices_connected,
+            (device_type, wait_timeout),
+            True,
+        ),
+    ]
+    # Check 3: ADB Keyboard installed (only for ADB) or WebDriverAgent (for iOS)
+    if device_type == DeviceType.ADB:
+        # Started only after the device check, so a missing device fails fast
+        # instead of leaving a probe blocked on it
+        checks.append(("3. Checking ADB Keyboard...", _check_adb_keyboard, (), False))
+    elif device_type == DeviceType.IOS:
+        checks.append(
+            (f"3. Checking WebDriverAgent ({wda_url})...", _check_wda, (wda_url,), True)
+        )
 
-    # Determine tool name and command
-    if device_type == DeviceType.IOS:
-        tool_name = "libimobiledevice"
-        tool_cmd = "idevice_id"
-    else:
-        tool_name = "ADB" if device_type == DeviceType.ADB else "HDC"
-        tool_cmd = "adb" if device_type == DeviceType.ADB else "hdc"
+    # Dependent checks start speculatively alongside the first one, unless the
+    # tool is missing from PATH and they are bound to fail
+    if _which(profile.tool_cmd) is None:
+        checks = checks[:1] + [(header, None, (), False) for header, *_ in checks[1:]]
 
-    # Check 1: Tool installed
-    print(f"1. Checking {tool_name} installation...", end=" ")
-    if shutil.which(tool_cmd) is None:
-        print("❌ FAILED")
-        print(f"   Error: {tool_name} is not installed or not in PATH.")
-        print(f"   Solution: Install {tool_name}:")
-        if device_type == DeviceType.ADB:
-            print("     - macOS: brew install android-platform-tools")
-            print("     - Linux: sudo apt install android-tools-adb")
-            print(
-                "     - Windows: Download from https://developer.android.com/studio/releases/platform-tools"
-            )
-        elif device_type == DeviceType.HDC:
-            print(
-                "     - Download from HarmonyOS SDK or https://gitee.com/openharmony/docs"
-            )
-            print("     - Add to PATH environment variable")
-        else:  # IOS
-            print("     - macOS: brew install libimobiledevice")
-            print("     - Linux: sudo apt-get install libimobiledevice-utils")
-        all_passed = False
-    else:
-        # Double check by running version command
-        try:
-            if device_type == DeviceType.ADB:
-                version_cmd = [tool_cmd, "version"]
-            elif device_type == DeviceType.HDC:
-                version_cmd = [tool_cmd, "-v"]
-            else:  # IOS
-                version_cmd = [tool_cmd, "-ln"]
-
-            result = subprocess.run(
-                version_cmd, capture_output=True, text=True, timeout=10
-            )
-            if result.returncode == 0:
-                version_line = result.stdout.strip().split("\n")[0]
-                print(f"✅ OK ({version_line if version_line else 'installed'})")
-            else:
-                print("❌ FAILED")
-                print(f"   Error: {tool_name} command failed to run.")
+    executor = ThreadPoolExecutor(max_workers=3)
+    try:
+        futures = [
+            executor.submit(check, *check_args)
+            if check is not None and speculative
+            else None
+            for _, check, check_args, speculative in checks
+        ]
+
+        all_passed = True
+        for (header, check, check_args, _), future in zip(checks, futures):
+            if not all_passed or check is None:
+                print(header, "⏭ SKIPPED (prerequisite failed)")
                 all_passed = False
-        except FileNotFoundError:
-            print("❌ FAILED")
-            print(f"   Error: {tool_name} command not found.")
-            all_passed = False
-        except subprocess.TimeoutExpired:
-            print("❌ FAILED")
-            print(f"   Error: {tool_name} command timed out.")
-            all_passed = False
-
-    # If ADB is not installed, skip remaining checks
-    if not all_passed:
-        print("-" * 50)
-        print("❌ System check failed. Please fix the issues above.")
-        return False
+                continue
 
-    # Check 2: Device connected
-    print("2. Checking connected devices...", end=" ")
-    try:
-        if device_type == DeviceType.ADB:
-            result = subprocess.run(
-                ["adb", "devices"], capture_output=True, text=True, timeout=10
-            )
-            lines = result.stdout.strip().split("\n")
-            # Filter out header and empty lines, look for 'device' status
-            devices = [
-                line for line in lines[1:] if line.strip() and "\tdevice" in line
-            ]
-        elif device_type == DeviceType.HDC:
-            result = subprocess.run(
-                ["hdc", "list", "targets"], capture_output=True, text=True, timeout=10
-            )
-            lines = result.stdout.strip().split("\n")
-            devices = [line for line in lines if line.strip()]
-        else:  # IOS
-            ios_devices = list_ios_devices()
-            devices = [d.device_id for d in ios_devices]
+            if future is None:
+                future = executor.submit(check, *check_args)
+            passed, lines = future.result()
+            print(header, "\n".join(lines))
+            all_passed = passed
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
-        if not devices:
-            print("❌ FAILED")
-            print("   Error: No devices connected.")
-            print("   Solution:")
-            if device_type == DeviceType.ADB:
-                print("     1. Enable USB debugging on your Android device")
-                print("     2. Connect via USB and authorize the connection")
-                print(
-                    "     3. Or connect remotely: python main.py --connect <ip>:<port>"
-                )
-            elif device_type == DeviceType.HDC:
-                print("     1. Enable USB debugging on your HarmonyOS device")
-                print("     2. Connect via USB and authorize the connection")
-                print(
-                    "     3. Or connect remotely: python main.py --device-type hdc --connect <ip>:<port>"
-                )
-            else:  # IOS
-                print("     1. Connect your iOS device via USB")
-                print("     2. Unlock device and tap 'Trust This Computer'")
-                print("     3. Verify: idevice_id -l")
-                print("     4. Or connect via WiFi using device IP")
-            all_passed = False
-        else:
-            if device_type == DeviceType.ADB:
-                device_ids = [d.split("\t")[0] for d in devices]
-            elif device_type == DeviceType.HDC:
-                device_ids = [d.strip() for d in devices]
-            else:  # IOS
-                device_ids = devices
-            print(
-                f"✅ OK ({len(devices)} device(s): {', '.join(device_ids[:2])}{'...' if len(device_ids) > 2 else ''})"
-            )
-    except subprocess.TimeoutExpired:
-        print("❌ FAILED")
-        print(f"   Error: {tool_name} command timed out.")
-        all_passed = False
-    except Exception as e:
-        print("❌ FAILED")
-        print(f"   Error: {e}")
-        all_passed = False
-
-    # If no device connected, skip ADB Keyboard check
     if not all_passed:
         print("-" * 50)
         print("❌ System check failed. Please fix the issues above.")
         return False
 
-    # Check 3: ADB Keyboard installed (only for ADB) or WebDriverAgent (for iOS)
-    if device_type == DeviceType.ADB:
-        print("3. Checking ADB Keyboard...", end=" ")
-        try:
-            result = subprocess.run(
-                ["adb", "shell", "ime", "list", "-s"],
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
-            ime_list = result.stdout.strip()
-
-            if "com.android.adbkeyboard/.AdbIME" in ime_list:
-                print("✅ OK")
-            else:
-                print("❌ FAILED")
-                print("   Error: ADB Keyboard is not installed on the device.")
-                print("   Solution:")
-                print("     1. Download ADB Keyboard APK from:")
-                print(
-                    "        https://github.com/senzhk/ADBKeyBoard/blob/master/ADBKeyboard.apk"
-                )
-                print("     2. Install it on your device: adb install ADBKeyboard.apk")
-                print(
-                    "     3. Enable it in Settings > System > Languages & Input > Virtual Keyboard"
-                )
-                all_passed = False
-        except subprocess.TimeoutExpired:
-            print("❌ FAILED")
-            print("   Error: ADB command timed out.")
-            all_passed = False
-        except Exception as e:
-            print("❌ FAILED")
-            print(f"   Error: {e}")
-            all_passed = False
-    elif device_type == DeviceType.HDC:
+    if device_type == DeviceType.HDC:
         # For HDC, skip keyboard check as it uses different input method
         print("3. Skipping keyboard check for HarmonyOS...", end=" ")
         print("✅ OK (using native input)")
-    else:  # IOS
-        # Check WebDriverAgent
-        print(f"3. Checking WebDriverAgent ({wda_url})...", end=" ")
+
+    print("-" * 50)
+    print("✅ All system checks passed!\n")
+
+    return True
+
+
+async def _run_in_daemon_thread(fn, *args):
+    """
+    Await fn(*args) running on a daemon thread.
+
+    Unlike run_in_executor, a call that is cancelled or abandoned never
+    delays interpreter exit.
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+
+    def settle(setter, value) -> None:
+        if not future.done():
+            setter(value)
+
+    def worker() -> None:
+        try:
+            result = fn(*args)
+        except BaseException as e:
+            outcome = (future.set_exception, e)
+        else:
+            outcome = (future.set_result, result)
         try:
-            conn = XCTestConnection(wda_url=wda_url)
+            loop.call_soon_threadsafe(settle, *outcome)
+        except RuntimeError:
+            pass  # The event loop has already been closed
 
-            if conn.is_wda_ready():
-                print("✅ OK")
-                # Get WDA status for additional info
-                status = conn.get_wda_status()
-                if status:
-                    session_id = status.get("sessionId", "N/A")
-                    print(f"   Session ID: {session_id}")
-            else:
-                print("❌ FAILED")
-                print("   Error: WebDriverAgent is not running or not accessible.")
-                print("   Solution:")
-                print("     1. Run WebDriverAgent on your iOS device via Xcode")
-                print("     2. For USB: Set up port forwarding: iproxy 8100 8100")
-                print(
-                    "     3. For WiFi: Use device IP, e.g., --wda-url http://192.168.1.100:8100"
-                )
-                print("     4. Verify in browser: open http://localhost:8100/status")
-                all_passed = False
-        except Exception as e:
-            print("❌ FAILED")
-            print(f"   Error: {e}")
-            all_passed = False
+    threading.Thread(target=worker, daemon=True).start()
+    return await future
 
-    print("-" * 50)
 
-    if all_passed:
-        print("✅ All system checks passed!\n")
-    else:
-        print("❌ System check failed. Please fix the issues above.")
+def _read_probe_latencies() -> list[float]:
+    """Read recent model API probe latencies, ignoring a missing or corrupt file."""
+    try:
+        with open(MODEL_LATENCY_PATH, "r", encoding="utf-8") as f:
+            samples = json.load(f)
+    except (OSError, ValueError):
+        return []
+    if not isinstance(samples, list):
+        return []
+    return [x for x in samples if isinstance(x, (int, float)) and x > 0]
+
+
+def _record_probe_latency(latency: float) -> None:
+    """Append a probe latency, keeping the last MODEL_LATENCY_SAMPLES."""
+    samples = (_read_probe_latencies() + [latency])[-MODEL_LATENCY_SAMPLES:]
+    tmp_path = f"{MODEL_LATENCY_PATH}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(MODEL_LATENCY_PATH), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(samples, f)
+        os.replace(tmp_path, MODEL_LATENCY_PATH)
+    except OSError:
+        pass
 
-    return all_passed
 
+def _initial_probe_timeout() -> float:
+    """
+    Pick the first probe timeout from past latencies.
 
-def check_model_api(base_url: str, model_name: str, api_key: str = "EMPTY") -> bool:
+    Uses the 99th percentile of the recorded samples, but never less than
+    MODEL_PROBE_MIN_TIMEOUT; MODEL_PROBE_TIMEOUT when there is no history.
     """
-    Check if the model API is accessible and the specified model exists.
+    samples = sorted(_read_probe_latencies())
+    if not samples:
+        return MODEL_PROBE_TIMEOUT
+    p99 = samples[min(len(samples) - 1, int(len(samples) * 0.99))]
+    return max(p99, MODEL_PROBE_MIN_TIMEOUT)
 
-    Checks:
-    1. Network connectivity to the API endpoint
-    2. Model exists in the available models list
+
+def _adaptive_probe(fn, budget: int = 3, initial: float = 2.0, growth: float = 2.0):
+    """
+    Call fn(timeout) with a growing timeout until it stops timing out.
+
+    A healthy server answers within the short first timeout, while a slow one
+    still gets up to initial * growth ** (budget - 1) seconds. Errors other
+    than timeouts are raised immediately.
 
     Args:
-        base_url: The API base URL
-        model_name: The model name to check
-        api_key: The API key for authentication
+        fn: Callable taking the timeout in seconds.
+        budget: Maximum number of attempts.
+        initial: Timeout of the first attempt in seconds.
+        growth: Factor applied to the timeout after each timed-out attempt.
 
     Returns:
-        True if all checks pass, False otherwise.
+        The result of the first call that did not time out.
     """
-    print("🔍 Checking model API...")
-    print("-" * 50)
+    from openai import APITimeoutError
 
-    all_passed = True
+    timeout = initial
+    for attempt in range(budget):
+        try:
+            return fn(timeout)
+        except APITimeoutError:
+            if attempt == budget - 1:
+                raise
+            timeout *= growth
+
+
+class _ModelProbeResult(NamedTuple):
+    """Outcome of a model API probe."""
+
+    error: Exception | None  # Why the API could not be used, if it could not
+    available_models: list[str] | None = None  # None if /models is disabled
+
+
+def _probe_model_api_sync(
+    base_url: str, model_name: str, api_key: str, deep: bool
+) -> _ModelProbeResult:
+    """Blocking body of _probe_model_api."""
+    from openai import NotFoundError, OpenAI
+
+    from phone_agent.model import get_shared_http_client
+
+    # The shared HTTP client keeps this connection open for the agent. Retries
+    # are left to _adaptive_probe, which raises the timeout between attempts.
+    client = OpenAI(
+        base_url=base_url,
+        api_key=api_key,
+        max_retries=0,
+        http_client=get_shared_http_client(),
+    )
+
+    def list_models(timeout: float) -> tuple[float, list[str] | None]:
+        start = time.monotonic()
+        try:
+            page = client.with_options(timeout=timeout).models.list()
+            model_ids = [model.id for model in page.data]
+        except NotFoundError:
+            model_ids = None
+        return time.monotonic() - start, model_ids
 
-    # Check 1: Network connectivity using chat API
-    print(f"1. Checking API connectivity ({base_url})...", end=" ")
     try:
-        # Create OpenAI client
-        client = OpenAI(base_url=base_url, api_key=api_key, timeout=30.0)
+        latency, model_ids = _adaptive_probe(
+            list_models, initial=_initial_probe_timeout()
+        )
+    except Exception as e:
+        return _ModelProbeResult(e)
+    _record_probe_latency(latency)
 
-        # Use chat completion to test connectivity (more universally supported than /models)
-        response = client.chat.completions.create(
+    # A model missing from the list is reported without running anything
+    if model_ids is not None and (model_name not in model_ids or not deep):
+        return _ModelProbeResult(None, model_ids)
+
+    try:
+        # A minimal chat completion exercises the model; it is also the only
+        # way to tell that the model exists when /models is disabled
+        response = client.with_options(timeout=30.0).chat.completions.create(
             model=model_name,
             messages=[{"role": "user", "content": "Hi"}],
             max_tokens=5,
             temperature=0.0,
             stream=False,
         )
+    except Exception as e:
+        return _ModelProbeResult(e, model_ids)
 
-        # Check if we got a valid response
-        if response.choices and len(response.choices) > 0:
-            print("✅ OK")
-        else:
-            print("❌ FAILED")
-            print("   Error: Received empty response from API")
-            all_passed = False
+    # Check if we got a valid response
+    if response.choices and len(response.choices) > 0:
+        return _ModelProbeResult(None, model_ids)
+    return _ModelProbeResult(ValueError("Received empty response from API"), model_ids)
 
-    except Exception as e:
+
+async def _probe_model_api(
+    base_url: str, model_name: str, api_key: str = "EMPTY", deep: bool = False
+) -> _ModelProbeResult:
+    """
+    Probe the model API and check that the model exists.
+
+    By default only GET /models is requested, which OpenAI-compatible
+    servers answer without running the model, and model_name is looked up
+    in the returned list. A server that has /models disabled (404) gets a
+    minimal chat completion instead. With deep=True the chat completion is
+    always sent, exercising the model itself.
+
+    The request goes through the shared model HTTP client, so the agent
+    created afterwards reuses its connection.
+
+    Returns:
+        The error, if the API was unreachable (or the chat completion failed),
+        and the models the server lists.
+    """
+    return await _run_in_daemon_thread(
+        _probe_model_api_sync, base_url, model_name, api_key, deep
+    )
+
+
+def _report_model_api(
+    base_url: str, model_name: str, probe: _ModelProbeResult
+) -> bool:
+    """Print the model API check results and return whether they passed."""
+    error, available_models = probe
+    print("🔍 Checking model API...")
+    print("-" * 50)
+
+    all_passed = True
+
+    # Check 1: Network connectivity
+    print(f"1. Checking API connectivity ({base_url})...", end=" ")
+    if error is None:
+        print("✅ OK")
+
+        # Check 2: Model exists, when the server lists its models
+        if available_models is not None:
+            print(f"2. Checking model '{model_name}'...", end=" ")
+            if model_name in available_models:
+                print("✅ OK")
+            else:
+                print("❌ FAILED")
+                print(f"   Error: Model '{model_name}' not found.")
+                print(f"   Available models:")
+                for m in available_models[:10]:  # Show first 10 models
+                    print(f"     - {m}")
+                if len(available_models) > 10:
+                    print(f"     ... and {len(available_models) - 10} more")
+                all_passed = False
+    else:
         print("❌ FAILED")
-        error_msg = str(e)
+        error_msg = str(error)
 
         # Provide more specific error messages
         if "Connection refused" in error_msg or "Connection error" in error_msg:
@@ -323,7 +764,7 @@ def check_model_api(base_url: str, model_name: str, api_key: str = "EMPTY") -> b
             print("   Solution:")
             print("     1. Check if the model server is running")
             print("     2. Verify the base URL is correct")
-            print(f"     3. Try: curl {base_url}/chat/completions")
+            print(f"     3. Try: curl {base_url}/models")
         elif "timed out" in error_msg.lower() or "timeout" in error_msg.lower():
             print(f"   Error: Connection to {base_url} timed out")
             print("   Solution:")
@@ -352,6 +793,95 @@ def check_model_api(base_url: str, model_name: str, api_key: str = "EMPTY") -> b
     return all_passed
 
 
+async def check_model_api_async(
+    base_url: str, model_name: str, api_key: str = "EMPTY", deep: bool = False
+) -> bool:
+    """
+    Check if the model API is accessible and the specified model exists.
+
+    Args:
+        base_url: The API base URL
+        model_name: The model name to check
+        api_key: The API key for authentication
+        deep: Also send a minimal chat completion to the model
+
+    Returns:
+        True if all checks pass, False otherwise.
+    """
+    probe = await _probe_model_api(base_url, model_name, api_key, deep)
+    return _report_model_api(base_url, model_name, probe)
+
+
+def check_model_api(
+    base_url: str, model_name: str, api_key: str = "EMPTY", deep: bool = False
+) -> bool:
+    """
+    Synchronous wrapper around check_model_api_async.
+
+    Returns:
+        True if all checks pass, False otherwise.
+    """
+    return asyncio.run(check_model_api_async(base_url, model_name, api_key, deep))
+
+
+async def run_startup_checks(
+    device_type: DeviceType,
+    wda_url: str,
+    base_url: str,
+    model_name: str,
+    api_key: str = "EMPTY",
+    device_id: str | None = None,
+    force_check: bool = False,
+    wait_timeout: float = 5.0,
+    deep_model_check: bool = False,
+) -> bool:
+    """
+    Run the system requirements and model API checks.
+
+    The model API round-trip is started first and overlaps with the device
+    probes; its results are only printed once the system check has passed.
+    Checks that passed within READINESS_CACHE_TTL seconds are skipped unless
+    force_check is set.
+
+    Returns:
+        True if both checks pass, False otherwise.
+    """
+    system_key = _readiness_key("system", device_type.value, device_id, wda_url)
+    model_key = _readiness_key(
+        "model", base_url, model_name, "deep" if deep_model_check else None
+    )
+    system_cached = not force_check and _is_ready_cached(system_key)
+    model_cached = not force_check and _is_ready_cached(model_key)
+
+    loop = asyncio.get_running_loop()
+    api_probe = None
+    if not model_cached:
+        api_probe = asyncio.create_task(
+            _probe_model_api(base_url, model_name, api_key, deep_model_check)
+        )
+
+    if system_cached:
+        print("✅ System checks passed (cached)\n")
+    else:
+        system_ok = await loop.run_in_executor(
+            None, check_system_requirements, device_type, wda_url, wait_timeout
+        )
+        if not system_ok:
+            if api_probe is not None:
+                api_probe.cancel()
+            return False
+        _save_readiness(system_key)
+
+    if api_probe is None:
+        print("✅ Model API check passed (cached)\n")
+        return True
+
+    if not _report_model_api(base_url, model_name, await api_probe):
+        return False
+    _save_readiness(model_key)
+    return True
+
+
 def parse_args() -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(
@@ -398,6 +928,9 @@ Examples:
 
     # Pair with iOS device
     python main.py --device-type ios --pair
+
+    # Re-run startup checks even if they passed recently
+    python main.py --force-check
         """,
     )
 
@@ -423,6 +956,12 @@ Examples:
         help="API key for model authentication",
     )
 
+    parser.add_argument(
+        "--deep-model-check",
+        action="store_true",
+        help="Send a test chat completion at startup instead of only listing models",
+    )
+
     parser.add_argument(
         "--max-steps",
         type=int,
@@ -460,6 +999,14 @@ Examples:
         "--list-devices", action="store_true", help="List connected devices and exit"
     )
 
+    parser.add_argument(
+        "--wait-timeout",
+        type=float,
+        default=5.0,
+        metavar="SECONDS",
+        help="Seconds to wait for an ADB device to come online (default: 5)",
+    )
+
     parser.add_argument(
         "--enable-tcpip",
         type=int,
@@ -498,6 +1045,12 @@ Examples:
         "--list-apps", action="store_true", help="List supported apps and exit"
     )
 
+    parser.add_argument(
+        "--force-check",
+        action="store_true",
+        help="Run startup checks even if a recent run passed them",
+    )
+
     parser.add_argument(
         "--lang",
         type=str,
@@ -531,11 +1084,13 @@ def handle_ios_device_commands(args) -> bool:
     Returns:
         True if a device command was handled (should exit), False otherwise.
     """
+    from phone_agent.xctest import XCTestConnection
+
     conn = XCTestConnection(wda_url=args.wda_url)
 
     # Handle --list-devices
     if args.list_devices:
-        devices = list_ios_devices()
+        devices = _cached_ios_devices()
         if not devices:
             print("No iOS devices connected.")
             print("\nTroubleshooting:")
@@ -606,11 +1161,7 @@ def handle_device_commands(args) -> bool:
     Returns:
         True if a device command was handled (should exit), False otherwise.
     """
-    device_type = (
-        DeviceType.ADB
-        if args.device_type == "adb"
-        else (DeviceType.HDC if args.device_type == "hdc" else DeviceType.IOS)
-    )
+    device_type = DeviceType(args.device_type)
 
     # Handle iOS-specific commands
     if device_type == DeviceType.IOS:
@@ -686,12 +1237,7 @@ def main():
     args = parse_args()
 
     # Set device type globally based on args
-    if args.device_type == "adb":
-        device_type = DeviceType.ADB
-    elif args.device_type == "hdc":
-        device_type = DeviceType.HDC
-    else:  # ios
-        device_type = DeviceType.IOS
+    device_type = DeviceType(args.device_type)
 
     # Set device type globally for non-iOS devices
     if device_type != DeviceType.IOS:
@@ -731,28 +1277,37 @@ def main():
     if handle_device_commands(args):
         return
 
-    # Run system requirements check before proceeding
-    if not check_system_requirements(
-        device_type,
-        wda_url=args.wda_url
-        if device_type == DeviceType.IOS
-        else "http://localhost:8100",
+    # Run system requirements and model API checks before proceeding
+    if not asyncio.run(
+        run_startup_checks(
+            device_type,
+            args.wda_url if device_type == DeviceType.IOS else "http://localhost:8100",
+            args.base_url,
+            args.model,
+            args.apikey,
+            device_id=args.device_id,
+            force_check=args.force_check,
+            wait_timeout=args.wait_timeout,
+            deep_model_check=args.deep_model_check,
+        )
     ):
         sys.exit(1)
 
-    # Check model API connectivity and model availability
-    if not check_model_api(args.base_url, args.model, args.apikey):
-        sys.exit(1)
+    from phone_agent.model import ModelConfig, get_shared_http_client
 
-    # Create configurations and agent based on device type
+    # Create configurations and agent based on device type; the agent shares
+    # the HTTP client, and so the connection, of the startup API check
     model_config = ModelConfig(
         base_url=args.base_url,
         model_name=args.model,
         api_key=args.apikey,
         lang=args.lang,
+        http_client=get_shared_http_client(),
     )
 
     if device_type == DeviceType.IOS:
+        from phone_agent.agent_ios import IOSAgentConfig, IOSPhoneAgent
+
         # Create iOS agent
         agent_config = IOSAgentConfig(
             max_steps=args.max_steps,
@@ -767,6 +1322,8 @@ def main():
             agent_config=agent_config,
         )
     else:
+        from phone_agent.agent import AgentConfig, PhoneAgent
+
         # Create Android/HarmonyOS agent
         agent_config = AgentConfig(
             max_steps=args.max_steps,
@@ -799,7 +1356,7 @@ def main():
 
     # Show device info
     if device_type == DeviceType.IOS:
-        devices = list_ios_devices()
+        devices = _cached_ios_devices()
         if agent_config.device_id:
             print(f"Device: {agent_config.device_id}")
         elif devices:
@@ -808,12 +1365,12 @@ def main():
             if device.model and device.ios_version:
                 print(f"        {device.model}, iOS {device.ios_version}")
     else:
-        device_factory = get_device_factory()
-        devices = device_factory.list_devices()
         if agent_config.device_id:
             print(f"Device: {agent_config.device_id}")
-        elif devices:
-            print(f"Device: {devices[0].device_id} (auto-detected)")
+        else:
+            device_ids = _connected_device_ids(device_type)
+            if device_ids:
+                print(f"Device: {device_ids[0]} (auto-detected)")
 
     print("=" * 50)
 
@@ -826,27 +1383,9 @@ def main():
         # Interactive mode
         print("\nEntering interactive mode. Type 'quit' to exit.\n")
 
-        while True:
-            try:
-                task = input("Enter your task: ").strip()
-
-                if task.lower() in ("quit", "exit", "q"):
-                    print("Goodbye!")
-                    break
-
-                if not task:
-                    continue
-
-                print()
-                result = agent.run(task)
-                print(f"\nResult: {result}\n")
-                agent.reset()
+        from phone_agent.interactive import run_interactive
 
-            except KeyboardInterrupt:
-                print("\n\nInterrupted. Goodbye!")
-                break
-            except Exception as e:
-                print(f"\nError: {e}\n")
+        run_interactive(agent, HISTORY_PATH)
 
 
 if __name__ == "__main__":
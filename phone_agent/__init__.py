@@ -5,8 +5,25 @@ This package provides tools for automating Android and iOS phone interactions
 using AI models for visual understanding and decision making.
 """
 
-from phone_agent.agent import PhoneAgent
-from phone_agent.agent_ios import IOSPhoneAgent
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from phone_agent.agent import PhoneAgent
+    from phone_agent.agent_ios import IOSPhoneAgent
 
 __version__ = "0.1.0"
 __all__ = ["PhoneAgent", "IOSPhoneAgent"]
+
+
+def __getattr__(name: str):
+    # The agents pull in the model client (openai), which is slow to import,
+    # so they are only loaded when first accessed
+    if name == "PhoneAgent":
+        from phone_agent.agent import PhoneAgent
+
+        return PhoneAgent
+    if name == "IOSPhoneAgent":
+        from phone_agent.agent_ios import IOSPhoneAgent
+
+        return IOSPhoneAgent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -329,6 +329,10 @@ class ActionHandler:
         input(f"{message}\nPress Enter after completing manual operation...")
 
 
+# Escapes applied in a single pass before the do(...) call is parsed
+_CONTROL_CHAR_ESCAPES = str.maketrans({"\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
 def parse_action(response: str) -> dict[str, Any]:
     """
     Parse action from model response.
@@ -355,9 +359,7 @@ def parse_action(response: str) -> dict[str, Any]:
             # Use AST parsing instead of eval for safety
             try:
                 # Escape special characters (newlines, tabs, etc.) for valid Python syntax
-                response = response.replace('\n', '\\n')
-                response = response.replace('\r', '\\r')
-                response = response.replace('\t', '\\t')
+                response = response.translate(_CONTROL_CHAR_ESCAPES)
 
                 tree = ast.parse(response, mode="eval")
                 if not isinstance(tree.body, ast.Call):
@@ -24,12 +24,21 @@ from phone_agent.adb.input import (
     restore_keyboard,
     type_text,
 )
-from phone_agent.adb.screenshot import cleanup_device_screenshots, get_screenshot
+from phone_agent.adb.screenshot import (
+    cleanup_device_screenshots,
+    cleanup_device_screenshots_async,
+    get_screenshot,
+    get_screenshot_and_current_app,
+    get_screenshot_async,
+)
 
 __all__ = [
     # Screenshot cleanup
     "get_screenshot",
+    "get_screenshot_and_current_app",
+    "get_screenshot_async",
     "cleanup_device_screenshots",
+    "cleanup_device_screenshots_async",
     "ScreenshotCleanupManager",
     "CleanupResult",
     # Input
@@ -1,11 +1,18 @@
 """Screenshot cleanup management module with retry, logging, and multi-device support."""
 
+import asyncio
+import shlex
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
 from typing import Optional, Tuple
 from datetime import datetime
 
+from phone_agent.adb.connection import _PersistentShell, _ensure_adb_server
+
 
 @dataclass
 class CleanupResult:
@@ -18,6 +25,18 @@ class CleanupResult:
     error_type: Optional[str] = None
 
 
+@dataclass(frozen=True, slots=True)
+class _LogEntry:
+    """One cleanup history record, kept compact until it is read."""
+    timestamp: float
+    device_id: Optional[str]
+    success: bool
+    message: str
+    attempt: int
+    total_attempts: int
+    error_type: Optional[str]
+
+
 class ScreenshotCleanupManager:
     """
     Manages cleanup of temporary screenshot files on Android devices.
@@ -35,6 +54,11 @@ class ScreenshotCleanupManager:
     DEFAULT_TIMEOUT = 5
     DEFAULT_MAX_RETRIES = 3
     DEFAULT_RETRY_DELAY = 0.5  # seconds
+    DEVICES_TTL = 2.0  # seconds to reuse the connected device list
+    HISTORY_SIZE = 1024  # most recent results kept in cleanup_history
+    
+    # Shared by all managers: (monotonic time, device IDs) of the last listing
+    _devices_cache: Tuple[float, list[str]] = (0.0, [])
     
     def __init__(
         self,
@@ -59,95 +83,62 @@ class ScreenshotCleanupManager:
         self.max_retries = max_retries
         self.retry_delay = retry_delay
         self.verbose = verbose
-        self.cleanup_history = []
+        self.cleanup_history: deque[_LogEntry] = deque(maxlen=self.HISTORY_SIZE)
+        self._history_lock = threading.Lock()
     
-    def cleanup(self, device_id: Optional[str] = None) -> CleanupResult:
+    def cleanup(
+        self,
+        device_id: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> CleanupResult:
         """
         Clean up screenshot file on the specified device with retry logic.
         
         Args:
             device_id: Optional ADB device ID. If None, uses default device.
+            deadline: Optional time.monotonic() value after which no further
+                attempt is started; backoff sleeps are shortened to fit.
         
         Returns:
             CleanupResult with status, message, and attempt information.
         """
         for attempt in range(1, self.max_retries + 1):
             try:
-                # Verify file exists before attempting cleanup
-                exists = self._file_exists(device_id)
-                if not exists:
-                    result = CleanupResult(
-                        success=True,
-                        message="Screenshot file does not exist (already cleaned or never created)",
-                        attempt=attempt,
-                        total_attempts=self.max_retries,
-                        device_id=device_id,
+                # Check, remove and verify in a single shell round-trip
+                status = self._remove_and_verify(device_id)
+                if status == "ABSENT":
+                    return self._finish(
+                        device_id, attempt, True,
+                        "Screenshot file does not exist (already cleaned or never created)",
                     )
-                    self._log(result, device_id)
-                    return result
-                
-                # Attempt cleanup
-                self._remove_file(device_id)
-                
-                # Verify cleanup success
-                if self._file_exists(device_id):
-                    # File still exists, retry
-                    self._log_attempt(f"Cleanup attempt {attempt}/{self.max_retries}: File still exists", device_id)
-                    if attempt < self.max_retries:
-                        time.sleep(self.retry_delay * attempt)  # Exponential backoff
-                        continue
-                    
-                    result = CleanupResult(
-                        success=False,
-                        message=f"File still exists after {self.max_retries} cleanup attempts",
-                        attempt=attempt,
-                        total_attempts=self.max_retries,
-                        device_id=device_id,
-                        error_type="cleanup_failed_file_persists",
+                if status == "REMOVED":
+                    return self._finish(
+                        device_id, attempt, True,
+                        f"Screenshot cleaned up successfully (attempt {attempt}/{self.max_retries})",
                     )
-                    self._log(result, device_id)
-                    return result
-                
-                # Success
-                result = CleanupResult(
-                    success=True,
-                    message=f"Screenshot cleaned up successfully (attempt {attempt}/{self.max_retries})",
-                    attempt=attempt,
-                    total_attempts=self.max_retries,
-                    device_id=device_id,
-                )
-                self._log(result, device_id)
-                return result
+                # File still exists, retry
+                reason = "File still exists"
+                message = f"File still exists after {attempt} cleanup attempts"
+                error_type = "cleanup_failed_file_persists"
             
             except subprocess.TimeoutExpired:
-                self._log_attempt(f"Cleanup attempt {attempt}/{self.max_retries}: ADB command timed out", device_id)
-                if attempt == self.max_retries:
-                    result = CleanupResult(
-                        success=False,
-                        message=f"Cleanup timed out after {self.max_retries} attempts",
-                        attempt=attempt,
-                        total_attempts=self.max_retries,
-                        device_id=device_id,
-                        error_type="cleanup_timeout",
-                    )
-                    self._log(result, device_id)
-                    return result
-                time.sleep(self.retry_delay * attempt)
+                reason = "ADB command timed out"
+                message = f"Cleanup timed out after {attempt} attempts"
+                error_type = "cleanup_timeout"
             
             except Exception as e:
-                self._log_attempt(f"Cleanup attempt {attempt}/{self.max_retries}: {type(e).__name__}: {str(e)}", device_id)
-                if attempt == self.max_retries:
-                    result = CleanupResult(
-                        success=False,
-                        message=f"Cleanup failed after {self.max_retries} attempts: {str(e)}",
-                        attempt=attempt,
-                        total_attempts=self.max_retries,
-                        device_id=device_id,
-                        error_type=type(e).__name__,
-                    )
-                    self._log(result, device_id)
-                    return result
-                time.sleep(self.retry_delay * attempt)
+                reason = f"{type(e).__name__}: {str(e)}"
+                message = f"Cleanup failed after {attempt} attempts: {str(e)}"
+                error_type = type(e).__name__
+            
+            self._log_attempt(f"Cleanup attempt {attempt}/{self.max_retries}: {reason}", device_id)
+            
+            delay = self.retry_delay * attempt  # Exponential backoff
+            if deadline is not None:
+                delay = min(delay, deadline - time.monotonic())
+            if attempt == self.max_retries or (deadline is not None and delay <= 0):
+                return self._finish(device_id, attempt, False, message, error_type)
+            time.sleep(delay)
         
         # Should not reach here, but just in case
         result = CleanupResult(
@@ -161,21 +152,41 @@ class ScreenshotCleanupManager:
         self._log(result, device_id)
         return result
     
+    async def cleanup_async(
+        self,
+        device_id: Optional[str] = None,
+        deadline: Optional[float] = None,
+    ) -> CleanupResult:
+        """
+        Clean up screenshot file without blocking the event loop.
+        
+        Runs cleanup() on a worker thread; its commands go through the
+        device's persistent shell either way.
+        
+        Args:
+            device_id: Optional ADB device ID. If None, uses default device.
+            deadline: Optional time.monotonic() deadline, as for cleanup().
+        
+        Returns:
+            CleanupResult with status, message, and attempt information.
+        """
+        return await asyncio.to_thread(self.cleanup, device_id, deadline)
+    
     def cleanup_all_devices(self) -> list[CleanupResult]:
         """
         Clean up screenshot files on all connected devices.
         
+        Devices are cleaned up concurrently, each over its own ADB channel.
+        
         Returns:
-            List of CleanupResult for each device.
+            List of CleanupResult for each device, in device order.
         """
         devices = self._get_connected_devices()
-        results = []
-        
-        for device_id in devices:
-            result = self.cleanup(device_id)
-            results.append(result)
+        if not devices:
+            return []
         
-        return results
+        with ThreadPoolExecutor(max_workers=min(32, len(devices))) as executor:
+            return list(executor.map(self.cleanup, devices))
     
     def cleanup_stale_files(
         self,
@@ -194,56 +205,20 @@ class ScreenshotCleanupManager:
         Returns:
             CleanupResult with status information.
         """
+        path = shlex.quote(self.screenshot_path)
+        threshold_seconds = int(max_age_hours * 3600)
+        # Age test and removal both run on the device, in one round-trip;
+        # the age uses the device clock, the same one that set the mtime
+        command = (
+            f"if T=$(stat -c %Y {path} 2>/dev/null); then "
+            f"AGE=$(($(date +%s) - T)); "
+            f"if [ $AGE -ge {threshold_seconds} ]; then rm -f {path}; "
+            f"if [ -f {path} ]; then echo STILL $AGE; else echo CLEANED $AGE; fi; "
+            f"else echo SKIPPED $AGE; fi; "
+            f"else echo MISSING; fi"
+        )
         try:
-            adb_prefix = self._get_adb_prefix(device_id)
-            
-            # Get file modification time
-            result = subprocess.run(
-                adb_prefix + ["shell", "stat", "-c", "%Y", self.screenshot_path],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
-            )
-            
-            if result.returncode != 0:
-                # File doesn't exist or stat failed
-                return CleanupResult(
-                    success=True,
-                    message="File does not exist or cannot stat",
-                    attempt=1,
-                    total_attempts=1,
-                    device_id=device_id,
-                )
-            
-            try:
-                file_mtime = int(result.stdout.strip())
-                current_time = int(time.time())
-                age_seconds = current_time - file_mtime
-                age_hours = age_seconds / 3600
-                
-                if age_hours >= max_age_hours:
-                    self._log_attempt(f"File is {age_hours:.1f} hours old, cleaning up", device_id)
-                    return self.cleanup(device_id)
-                else:
-                    result_obj = CleanupResult(
-                        success=True,
-                        message=f"File is only {age_hours:.1f} hours old (threshold: {max_age_hours}h), skipping cleanup",
-                        attempt=1,
-                        total_attempts=1,
-                        device_id=device_id,
-                    )
-                    self._log(result_obj, device_id)
-                    return result_obj
-            except ValueError:
-                return CleanupResult(
-                    success=False,
-                    message="Could not parse file modification time",
-                    attempt=1,
-                    total_attempts=1,
-                    device_id=device_id,
-                    error_type="parse_error",
-                )
-        
+            _, output = _PersistentShell.for_device(device_id).run(command, self.timeout)
         except Exception as e:
             return CleanupResult(
                 success=False,
@@ -253,6 +228,55 @@ class ScreenshotCleanupManager:
                 device_id=device_id,
                 error_type=type(e).__name__,
             )
+        
+        status, _, age = output.strip().partition(" ")
+        if status == "MISSING":
+            # File doesn't exist or stat failed
+            return CleanupResult(
+                success=True,
+                message="File does not exist or cannot stat",
+                attempt=1,
+                total_attempts=1,
+                device_id=device_id,
+            )
+        
+        try:
+            age_hours = int(age) / 3600
+        except ValueError:
+            return CleanupResult(
+                success=False,
+                message="Could not parse file modification time",
+                attempt=1,
+                total_attempts=1,
+                device_id=device_id,
+                error_type="parse_error",
+            )
+        
+        if status == "SKIPPED":
+            result_obj = CleanupResult(
+                success=True,
+                message=f"File is only {age_hours:.1f} hours old (threshold: {max_age_hours}h), skipping cleanup",
+                attempt=1,
+                total_attempts=1,
+                device_id=device_id,
+            )
+            self._log(result_obj, device_id)
+            return result_obj
+        
+        self._log_attempt(f"File is {age_hours:.1f} hours old, cleaning up", device_id)
+        if status == "CLEANED":
+            result_obj = CleanupResult(
+                success=True,
+                message="Stale screenshot cleaned up successfully",
+                attempt=1,
+                total_attempts=1,
+                device_id=device_id,
+            )
+            self._log(result_obj, device_id)
+            return result_obj
+        
+        # rm did not take; fall back to the retrying cleanup
+        return self.cleanup(device_id)
     
     def get_file_info(self, device_id: Optional[str] = None) -> dict:
         """
@@ -265,32 +289,19 @@ class ScreenshotCleanupManager:
             Dictionary with file information (size, mtime, exists, etc.)
         """
         try:
-            adb_prefix = self._get_adb_prefix(device_id)
-            
-            # Check if file exists and get size
-            result = subprocess.run(
-                adb_prefix + ["shell", "ls", "-la", self.screenshot_path],
-                capture_output=True,
-                text=True,
-                timeout=self.timeout,
+            # Size and mtime as plain integers; stat fails if the file is absent
+            returncode, output = _PersistentShell.for_device(device_id).run(
+                f"stat -c '%s %Y' {shlex.quote(self.screenshot_path)}", self.timeout
             )
             
-            if result.returncode != 0 or "No such file" in result.stderr:
+            if returncode != 0:
                 return {
                     "exists": False,
                     "device_id": device_id,
                     "path": self.screenshot_path,
                 }
             
-            # Parse ls output: -rw-rw---- 1 root sdcard_rw 2097152 Dec 20 10:30 /sdcard/tmp.png
-            parts = result.stdout.split()
-            if len(parts) >= 5:
-                try:
-                    size = int(parts[4])
-                except ValueError:
-                    size = 0
-            else:
-                size = 0
+            size, mtime = map(int, output.split())
             
             return {
                 "exists": True,
@@ -298,7 +309,8 @@ class ScreenshotCleanupManager:
                 "path": self.screenshot_path,
                 "size": size,
                 "size_mb": round(size / (1024 * 1024), 2),
-                "raw_output": result.stdout.strip(),
+                "mtime": mtime,
+                "raw_output": output.strip(),
             }
         
         except Exception as e:
@@ -310,35 +322,56 @@ class ScreenshotCleanupManager:
             }
     
     def get_cleanup_history(self) -> list[dict]:
-        """Get the cleanup attempt history."""
-        return self.cleanup_history.copy()
+        """Get the most recent cleanup results (up to HISTORY_SIZE), oldest first."""
+        with self._history_lock:
+            entries = list(self.cleanup_history)
+        history = []
+        for entry in entries:
+            record = asdict(entry)
+            record["timestamp"] = datetime.fromtimestamp(entry.timestamp).isoformat()
+            history.append(record)
+        return history
     
     # Private helper methods
     
-    def _file_exists(self, device_id: Optional[str] = None) -> bool:
-        """Check if screenshot file exists on the device."""
+    def _remove_and_verify(self, device_id: Optional[str] = None) -> str:
+        """
+        Remove the screenshot file and check that it is gone, in one command.
+
+        Returns:
+            "ABSENT" if there was no file, "REMOVED" if it was deleted, or
+            "STILL" if it is still there after rm. Errors other than a timeout
+            count as "ABSENT".
+
+        Raises:
+            subprocess.TimeoutExpired: If the command did not finish in time.
+        """
+        path = shlex.quote(self.screenshot_path)
+        command = (
+            f"if [ -f {path} ]; then rm -f {path}; "
+            f"if [ -f {path} ]; then echo STILL; else echo REMOVED; fi; "
+            f"else echo ABSENT; fi"
+        )
         try:
-            adb_prefix = self._get_adb_prefix(device_id)
-            result = subprocess.run(
-                adb_prefix + ["shell", "test", "-f", self.screenshot_path],
-                capture_output=True,
-                timeout=self.timeout,
-            )
-            return result.returncode == 0
+            _, output = _PersistentShell.for_device(device_id).run(command, self.timeout)
+        except subprocess.TimeoutExpired:
+            raise
         except Exception:
-            return False
+            return "ABSENT"
+        status = output.strip()
+        return status if status in ("ABSENT", "REMOVED") else "STILL"
     
-    def _remove_file(self, device_id: Optional[str] = None) -> None:
-        """Remove screenshot file from the device."""
-        adb_prefix = self._get_adb_prefix(device_id)
-        subprocess.run(
-            adb_prefix + ["shell", "rm", "-f", self.screenshot_path],
-            capture_output=True,
-            timeout=self.timeout,
-        )
+    @classmethod
+    def refresh_devices(cls) -> None:
+        """Drop the cached device list so the next lookup queries adb again."""
+        ScreenshotCleanupManager._devices_cache = (0.0, [])
     
     def _get_connected_devices(self) -> list[str]:
-        """Get list of connected ADB device IDs."""
+        """Get list of connected ADB device IDs, reused for DEVICES_TTL seconds."""
+        timestamp, devices = ScreenshotCleanupManager._devices_cache
+        if timestamp and time.monotonic() - timestamp < self.DEVICES_TTL:
+            return list(devices)
+        _ensure_adb_server()
         try:
             result = subprocess.run(
                 ["adb", "devices"],
@@ -351,34 +384,49 @@ class ScreenshotCleanupManager:
                 parts = line.split()
                 if len(parts) >= 2 and parts[1] == "device":
                     devices.append(parts[0])
-            return devices
+            ScreenshotCleanupManager._devices_cache = (time.monotonic(), devices)
+            return list(devices)
         except Exception:
             return []
     
-    @staticmethod
-    def _get_adb_prefix(device_id: Optional[str] = None) -> list:
-        """Get ADB command prefix with optional device specifier."""
-        if device_id:
-            return ["adb", "-s", device_id]
-        return ["adb"]
-    
     def _log(self, result: CleanupResult, device_id: Optional[str] = None) -> None:
         """Log cleanup result to history and optionally print."""
-        log_entry = {
-            "timestamp": datetime.now().isoformat(),
-            "device_id": result.device_id or device_id,
-            "success": result.success,
-            "message": result.message,
-            "attempt": result.attempt,
-            "total_attempts": result.total_attempts,
-            "error_type": result.error_type,
-        }
-        self.cleanup_history.append(log_entry)
+        log_entry = _LogEntry(
+            timestamp=time.time(),
+            device_id=result.device_id or device_id,
+            success=result.success,
+            message=result.message,
+            attempt=result.attempt,
+            total_attempts=result.total_attempts,
+            error_type=result.error_type,
+        )
+        with self._history_lock:
+            self.cleanup_history.append(log_entry)
         
         if self.verbose:
             status_icon = "✅" if result.success else "❌"
             print(f"{status_icon} Cleanup ({result.attempt}/{result.total_attempts}): {result.message}")
     
+    def _finish(
+        self,
+        device_id: Optional[str],
+        attempt: int,
+        success: bool,
+        message: str,
+        error_type: Optional[str] = None,
+    ) -> CleanupResult:
+        """Build the final CleanupResult of a cleanup run and log it."""
+        result = CleanupResult(
+            success=success,
+            message=message,
+            attempt=attempt,
+            total_attempts=self.max_retries,
+            device_id=device_id,
+            error_type=error_type,
+        )
+        self._log(result, device_id)
+        return result
+    
     def _log_attempt(self, message: str, device_id: Optional[str] = None) -> None:
         """Log an intermediate attempt message."""
         if self.verbose:
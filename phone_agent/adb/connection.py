@@ -1,14 +1,237 @@
 """ADB connection management for local and remote devices."""
 
+import atexit
+import queue
+import shlex
 import subprocess
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from typing import Optional, Tuple
 
 from phone_agent.config.timing import TIMING_CONFIG
 
 
+# Whether this process has already made sure the adb server is running
+_adb_server_started = False
+_adb_server_lock = threading.Lock()
+
+
+def _ensure_adb_server(adb_path: str = "adb") -> None:
+    """
+    Start the adb server once per process, before the first adb command.
+
+    Otherwise the first few adb invocations (often issued concurrently at
+    startup) can each hit the daemon auto-start slow path. Later calls
+    return immediately; failures are left for the real command to report.
+    """
+    global _adb_server_started
+    if _adb_server_started:
+        return
+    with _adb_server_lock:
+        if _adb_server_started:
+            return
+        try:
+            subprocess.run(
+                [adb_path, "start-server"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=10,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+        _adb_server_started = True
+
+
+_BATCH_SEPARATOR = b"__ADB_BATCH_SEP__"
+
+
+def _adb_batch(device_id: Optional[str], commands: list[str], timeout: float) -> list[bytes]:
+    """
+    Run several shell commands over a single `adb exec-out` connection.
+
+    The commands run in order, separated by an echoed marker line, so one
+    connection setup is paid instead of one per command. exec-out does not
+    mangle line endings, so the last command may write binary data.
+
+    Args:
+        device_id: Optional ADB device ID.
+        commands: Shell command lines; only the last may output binary data.
+        timeout: Seconds to wait for all commands together.
+
+    Returns:
+        Stdout of each command, in order.
+
+    Raises:
+        subprocess.TimeoutExpired: If the commands did not finish in time.
+        RuntimeError: If the output could not be split per command.
+    """
+    _ensure_adb_server()
+    prefix = ["adb", "-s", device_id] if device_id else ["adb"]
+    separator = _BATCH_SEPARATOR.decode("ascii")
+    script = f"; echo {separator}; ".join(commands)
+    result = subprocess.run(
+        prefix + ["exec-out", script], capture_output=True, timeout=timeout
+    )
+    parts = result.stdout.split(_BATCH_SEPARATOR + b"\n", len(commands) - 1)
+    if len(parts) != len(commands):
+        raise RuntimeError(f"Unexpected adb batch output: {result.stderr!r}")
+    return parts
+
+
+class _PersistentShell:
+    """
+    A long-lived `adb shell` process that runs commands one at a time.
+
+    Spawning `adb shell` costs a process start plus an ADB connection setup,
+    which dominates cheap commands such as `input tap` or `rm -f`. Commands are
+    instead written to the stdin of one shell per device, and their output is
+    read up to a sentinel line carrying the exit status.
+    """
+
+    _SENTINEL = "__RC_"
+    _shells: dict = {}
+    _shells_lock = threading.Lock()
+
+    def __init__(self, device_id: Optional[str] = None):
+        self.device_id = device_id
+        self._proc: Optional[subprocess.Popen] = None
+        self._lines: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_device(cls, device_id: Optional[str] = None) -> "_PersistentShell":
+        """Get the shared shell for a device, creating it on first use."""
+        with cls._shells_lock:
+            shell = cls._shells.get(device_id)
+            if shell is None:
+                shell = cls._shells[device_id] = cls(device_id)
+            return shell
+
+    @classmethod
+    def close_all(cls) -> None:
+        """Terminate every shared shell."""
+        with cls._shells_lock:
+            shells = list(cls._shells.values())
+            cls._shells.clear()
+        for shell in shells:
+            shell.close()
+
+    def run(self, command: str, timeout: float) -> Tuple[int, str]:
+        """
+        Run a shell command on the device.
+
+        A shell that has died (e.g. the device reconnected) before the command
+        could be written is respawned and the command sent once more. Once the
+        command has been written it is never resent, since it may have run.
+
+        Args:
+            command: Shell command line.
+            timeout: Seconds to wait for the command to finish.
+
+        Returns:
+            Tuple of (exit status, stdout).
+
+        Raises:
+            EOFError: If the shell exited before the command finished.
+            OSError: If the respawned shell could not take the command either.
+            subprocess.TimeoutExpired: If the command did not finish in time.
+        """
+        with self._lock:
+            try:
+                self._write(command)
+            except OSError:
+                self.close()
+                self._write(command)
+            return self._read(command, timeout)
+
+    def close(self) -> None:
+        """Terminate the shell process."""
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+    def _start(self) -> None:
+        """Spawn the shell process if it is not running."""
+        if self._proc is not None and self._proc.poll() is None:
+            return
+        _ensure_adb_server()
+        prefix = ["adb", "-s", self.device_id] if self.device_id else ["adb"]
+        self._proc = subprocess.Popen(
+            prefix + ["shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0,
+        )
+        self._lines = queue.Queue()
+        threading.Thread(
+            target=self._pump, args=(self._proc.stdout, self._lines), daemon=True
+        ).start()
+
+    @staticmethod
+    def _pump(stdout, lines: "queue.Queue[Optional[str]]") -> None:
+        """Forward stdout lines to the queue; None marks end of output."""
+        for line in iter(stdout.readline, b""):
+            lines.put(line.decode("utf-8", "replace").rstrip("\r\n"))
+        lines.put(None)
+
+    def _write(self, command: str) -> None:
+        """Write a command to the shell, spawning the shell if needed."""
+        self._start()
+        self._proc.stdin.write(f"{command}; echo {self._SENTINEL}$?\n".encode("utf-8"))
+        self._proc.stdin.flush()
+
+    def _read(self, command: str, timeout: float) -> Tuple[int, str]:
+        """Collect the output of the command written last."""
+        deadline = time.monotonic() + timeout
+        output = []
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                # The shell is mid-command; it cannot be reused
+                self.close()
+                raise subprocess.TimeoutExpired(command, timeout)
+            if line is None:
+                self.close()
+                raise EOFError("adb shell exited")
+            # Output without a trailing newline shares its last line with the sentinel
+            text, sentinel, status = line.rpartition(self._SENTINEL)
+            if not sentinel:
+                output.append(line)
+                continue
+            if text:
+                output.append(text)
+            return int(status), "\n".join(output)
+
+
+atexit.register(_PersistentShell.close_all)
+
+
+# Upper bound for one input or launch command (long presses run for seconds)
+SHELL_COMMAND_TIMEOUT = 30
+
+
+def _run_shell(device_id: Optional[str], *args: str) -> None:
+    """
+    Run a command on the device's persistent adb shell and wait for it.
+
+    Input commands are not idempotent, so a command that was sent is never
+    retried; see _PersistentShell.run. ActionHandler.execute turns these
+    errors into a failed action result, and the agent carries on from the
+    next screenshot.
+
+    Raises:
+        EOFError: If the shell exited before the command finished.
+        OSError: If adb could not be started or take the command.
+        subprocess.TimeoutExpired: If the command did not finish in time.
+    """
+    _PersistentShell.for_device(device_id).run(shlex.join(args), SHELL_COMMAND_TIMEOUT)
+
+
 class ConnectionType(Enum):
     """Type of ADB connection."""
 
@@ -312,16 +535,25 @@ class ADBConnection:
         try:
             # Kill server
             subprocess.run(
-                [self.adb_path, "kill-server"], capture_output=True, timeout=5
+                [self.adb_path, "kill-server"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
             )
 
             time.sleep(TIMING_CONFIG.connection.server_restart_delay)
 
             # Start server
             subprocess.run(
-                [self.adb_path, "start-server"], capture_output=True, timeout=5
+                [self.adb_path, "start-server"],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
             )
 
+            global _adb_server_started
+            _adb_server_started = True
+
             return True, "ADB server restarted"
 
         except Exception as e:
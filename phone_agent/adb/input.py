@@ -4,6 +4,8 @@ import base64
 import subprocess
 from typing import Optional
 
+from phone_agent.adb.connection import _ensure_adb_server, _run_shell
+
 
 def type_text(text: str, device_id: str | None = None) -> None:
     """
@@ -17,23 +19,10 @@ def type_text(text: str, device_id: str | None = None) -> None:
         Requires ADB Keyboard to be installed on the device.
         See: https://github.com/nicnocquee/AdbKeyboard
     """
-    adb_prefix = _get_adb_prefix(device_id)
     encoded_text = base64.b64encode(text.encode("utf-8")).decode("utf-8")
 
-    subprocess.run(
-        adb_prefix
-        + [
-            "shell",
-            "am",
-            "broadcast",
-            "-a",
-            "ADB_INPUT_B64",
-            "--es",
-            "msg",
-            encoded_text,
-        ],
-        capture_output=True,
-        text=True,
+    _run_shell(
+        device_id, "am", "broadcast", "-a", "ADB_INPUT_B64", "--es", "msg", encoded_text
     )
 
 
@@ -44,13 +33,7 @@ def clear_text(device_id: str | None = None) -> None:
     Args:
         device_id: Optional ADB device ID for multi-device setups.
     """
-    adb_prefix = _get_adb_prefix(device_id)
-
-    subprocess.run(
-        adb_prefix + ["shell", "am", "broadcast", "-a", "ADB_CLEAR_TEXT"],
-        capture_output=True,
-        text=True,
-    )
+    _run_shell(device_id, "am", "broadcast", "-a", "ADB_CLEAR_TEXT")
 
 
 def detect_and_set_adb_keyboard(device_id: str | None = None) -> str:
@@ -77,8 +60,8 @@ def detect_and_set_adb_keyboard(device_id: str | None = None) -> str:
     if "com.android.adbkeyboard/.AdbIME" not in current_ime:
         subprocess.run(
             adb_prefix + ["shell", "ime", "set", "com.android.adbkeyboard/.AdbIME"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
 
     # Warm up the keyboard
@@ -98,12 +81,15 @@ def restore_keyboard(ime: str, device_id: str | None = None) -> None:
     adb_prefix = _get_adb_prefix(device_id)
 
     subprocess.run(
-        adb_prefix + ["shell", "ime", "set", ime], capture_output=True, text=True
+        adb_prefix + ["shell", "ime", "set", ime],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
 
 def _get_adb_prefix(device_id: str | None) -> list:
     """Get ADB command prefix with optional device specifier."""
+    _ensure_adb_server()
     if device_id:
         return ["adb", "-s", device_id]
     return ["adb"]
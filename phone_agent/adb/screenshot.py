@@ -1,16 +1,31 @@
 """Screenshot utilities for capturing Android device screen."""
 
+import asyncio
 import base64
-import os
+import functools
+import re
 import subprocess
-import tempfile
-import uuid
+import time
 from dataclasses import dataclass
 from io import BytesIO
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
-from PIL import Image
+from phone_agent.adb.connection import _adb_batch, _ensure_adb_server
+from phone_agent.adb.device import _app_from_window_dump, get_current_app
+from phone_agent.adb.emulator import get_emulator_png, grpc_port
 
+if TYPE_CHECKING:
+    from PIL import Image
+
+# PIL is imported inside the functions that decode or build images, so
+# importing this module (and the phone_agent.adb package) stays cheap for
+# callers that never take a screenshot
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# screencap stderr that marks a capture as refused rather than just failed
+_SENSITIVE_ERROR_RE = re.compile(r"permission denied|error", re.IGNORECASE)
 
 @dataclass
 class Screenshot:
@@ -20,9 +35,38 @@ class Screenshot:
     width: int
     height: int
     is_sensitive: bool = False
+    is_black: bool = False  # Device kept returning black frames
+
+
+def _dark_ratio(img: "Image.Image", size: tuple[int, int]) -> float:
+    """
+    Get the share of dark pixels in a nearest-neighbour sample of an image.
 
+    Args:
+        img: PIL Image object.
+        size: Size of the sample to count.
 
-def _is_black_image(img: Image.Image, threshold: int = 20) -> bool:
+    Returns:
+        Fraction of sampled pixels whose R, G and B are all below 50.
+    """
+    from PIL import Image, ImageChops
+
+    sample = img.resize(size, Image.Resampling.NEAREST)
+
+    # Convert to RGB if needed
+    if sample.mode != 'RGB':
+        sample = sample.convert('RGB')
+    
+    # A pixel is dark when R, G, B are all < 50, i.e. its brightest channel is.
+    # Take the per-pixel channel maximum and count it with a histogram so the
+    # work stays in PIL's C code instead of a Python loop over every pixel.
+    r, g, b = sample.split()
+    brightest = ImageChops.lighter(ImageChops.lighter(r, g), b)
+    dark_pixels = sum(brightest.histogram()[:50])
+    return dark_pixels / (sample.width * sample.height)
+
+
+def _is_black_image(img: "Image.Image", threshold: int = 20) -> bool:
     """
     Check if an image is mostly black (likely a failed screenshot).
     
@@ -33,16 +77,16 @@ def _is_black_image(img: Image.Image, threshold: int = 20) -> bool:
     Returns:
         True if image is mostly black, False otherwise.
     """
-    # Convert to RGB if needed
-    if img.mode != 'RGB':
-        img = img.convert('RGB')
-    
-    # Get image data
-    pixels = list(img.getdata())
-    
-    # Count dark pixels (R, G, B all < 50)
-    dark_pixels = sum(1 for r, g, b in pixels if r < 50 and g < 50 and b < 50)
-    dark_ratio = dark_pixels / len(pixels)
+    # Most frames are not black: a 32x64 probe where under half the pixels
+    # are dark settles it without building the larger sample
+    if _dark_ratio(img, (32, 64)) < 0.5:
+        return False
+
+    # Every 10th pixel along each axis is plenty to tell whether 95% of the
+    # frame is dark, and leaves 100x fewer pixels to convert and count
+    dark_ratio = _dark_ratio(
+        img, (max(1, img.width // 10), max(1, img.height // 10))
+    )
     
     # If more than 95% of pixels are dark, it's a black image
     return dark_ratio > 0.95
@@ -63,130 +107,262 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10, retry_count:
     Note:
         If the screenshot fails (e.g., on sensitive screens like payment pages),
         a black fallback image is returned with is_sensitive=True.
+
+        The capture is a single adb round-trip that never writes to device
+        storage, so no cleanup call is needed afterwards.
     """
-    for attempt in range(retry_count):
-        temp_path = os.path.join(tempfile.gettempdir(), f"screenshot_{uuid.uuid4()}.png")
-        adb_prefix = _get_adb_prefix(device_id)
+    adb_prefix = _get_adb_prefix(device_id)
 
+    for attempt in range(retry_count):
         try:
-            # Execute screenshot command
-            result = subprocess.run(
-                adb_prefix + ["shell", "screencap", "-p", "/sdcard/tmp.png"],
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-            )
-
-            # Check for screenshot command failure (return code != 0)
-            if result.returncode != 0:
-                print(f"[screenshot.py] Screenshot command failed on attempt {attempt + 1}/{retry_count}: {result.stderr}")
-                # Retry instead of immediately returning fallback
-                if attempt < retry_count - 1:
-                    import time
-                    time.sleep(0.3)
-                    continue
-                # Only mark as sensitive if the error explicitly indicates it
-                # (e.g., specific ADB errors related to permissions)
-                is_sensitive_error = "Permission denied" in result.stderr or "error" in result.stderr.lower()
-                print(f"[screenshot.py] All retries exhausted, returning fallback (is_sensitive={is_sensitive_error})")
-                return _create_fallback_screenshot(is_sensitive=is_sensitive_error)
-
-            # Pull screenshot to local temp path
-            pull_result = subprocess.run(
-                adb_prefix + ["pull", "/sdcard/tmp.png", temp_path],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-
-            if pull_result.returncode != 0 or not os.path.exists(temp_path):
-                if attempt < retry_count - 1:
-                    import time
-                    time.sleep(0.2)
-                    continue
-                return _create_fallback_screenshot(is_sensitive=False)
-
-            # Read and encode image
-            try:
-                img = Image.open(temp_path)
-                width, height = img.size
-
-                # Check if the image is mostly black (likely a screenshot failure, not sensitive)
-                if _is_black_image(img):
-                    print(f"[screenshot.py] Detected black image on attempt {attempt + 1}/{retry_count}, retrying...")
-                    if os.path.exists(temp_path):
-                        os.remove(temp_path)
-                    # Retry on black image
-                    if attempt < retry_count - 1:
-                        import time
-                        time.sleep(0.2)
-                        continue
-                    # After all retries, return non-sensitive fallback
-                    print(f"[screenshot.py] All {retry_count} retries exhausted for black image, returning fallback")
-                    return _create_fallback_screenshot(is_sensitive=False)
-
-                buffered = BytesIO()
-                img.save(buffered, format="PNG")
-                base64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-                # Cleanup
-                os.remove(temp_path)
-
-                return Screenshot(
-                    base64_data=base64_data, width=width, height=height, is_sensitive=False
+            # Emulators with a gRPC endpoint hand over the frame directly
+            png = get_emulator_png(device_id, timeout)
+            if png is not None:
+                screenshot, delay = _screenshot_from_capture(
+                    0, png, b"", attempt, retry_count
+                )
+            else:
+                # Stream the PNG over stdout: no device-side file, no separate pull
+                result = subprocess.run(
+                    adb_prefix + ["exec-out", "screencap", "-p"],
+                    capture_output=True,
+                    timeout=timeout,
+                )
+                screenshot, delay = _screenshot_from_capture(
+                    result.returncode, result.stdout, result.stderr, attempt, retry_count
                 )
-            except (OSError, IOError) as img_error:
-                # Image file corrupted or unreadable
-                if os.path.exists(temp_path):
-                    os.remove(temp_path)
-                if attempt < retry_count - 1:
-                    import time
-                    time.sleep(0.2)
-                    continue
-                return _create_fallback_screenshot(is_sensitive=False)
-
-        except Exception as e:
+        except Exception:
             # Unexpected error - return non-sensitive fallback
-            if attempt < retry_count - 1:
-                import time
-                time.sleep(0.2)
-                continue
-            return _create_fallback_screenshot(is_sensitive=False)
+            screenshot, delay = _retry_or_fallback(attempt, retry_count, 0.2)
+
+        if screenshot is not None:
+            return screenshot
+        time.sleep(delay)
     
     # Fallback if all retries exhausted
     return _create_fallback_screenshot(is_sensitive=False)
 
 
+def get_screenshot_and_current_app(
+    device_id: str | None = None, timeout: int = 10, retry_count: int = 3
+) -> tuple[Screenshot, str]:
+    """
+    Capture a screenshot and get the focused app in one adb round-trip.
+
+    The window focus lines and the PNG come back over a single exec-out
+    connection. If the frame needs a retry (black or unreadable), the
+    screenshot falls back to get_screenshot; if the focus lines are
+    missing, the app falls back to get_current_app.
+
+    Args:
+        device_id: Optional ADB device ID for multi-device setups.
+        timeout: Timeout in seconds for screenshot operations.
+        retry_count: Number of times to retry if black image is detected.
+
+    Returns:
+        Tuple of (screenshot, current app name).
+    """
+    if grpc_port(device_id) is not None:
+        # The emulator's gRPC screenshot beats screencap over adb
+        return get_screenshot(device_id, timeout, retry_count), get_current_app(device_id)
+
+    try:
+        focus, png = _adb_batch(
+            device_id,
+            ["dumpsys window | grep -E 'mCurrentFocus|mFocusedApp'", "screencap -p"],
+            timeout,
+        )
+    except Exception:
+        focus, png = b"", b""
+
+    screenshot = None
+    if png.startswith(_PNG_SIGNATURE):
+        screenshot, _ = _screenshot_from_capture(0, png, b"", 0, retry_count)
+    if screenshot is None:
+        screenshot = get_screenshot(device_id, timeout, retry_count)
+
+    focus_text = focus.decode("utf-8", "replace")
+    if focus_text.strip():
+        current_app = _app_from_window_dump(focus_text)
+    else:
+        current_app = get_current_app(device_id)
+
+    return screenshot, current_app
+
+
+async def get_screenshot_async(
+    device_id: str | None = None, timeout: int = 10, retry_count: int = 3
+) -> Screenshot:
+    """
+    Capture a screenshot without blocking the event loop.
+
+    Same behaviour as get_screenshot, including the emulator gRPC path, but
+    adb runs as an asyncio subprocess and the gRPC call, PNG decoding and
+    black-frame check run on the default executor, so other coroutines
+    (model requests, actions on other devices) proceed while the capture is
+    in flight.
+
+    Args:
+        device_id: Optional ADB device ID for multi-device setups.
+        timeout: Timeout in seconds for screenshot operations.
+        retry_count: Number of times to retry if black image is detected.
+
+    Returns:
+        Screenshot object containing base64 data and dimensions.
+    """
+    loop = asyncio.get_running_loop()
+    adb_prefix = _get_adb_prefix(device_id)
+
+    for attempt in range(retry_count):
+        try:
+            # Emulators with a gRPC endpoint hand over the frame directly
+            png = None
+            if grpc_port(device_id) is not None:
+                png = await loop.run_in_executor(
+                    None, get_emulator_png, device_id, timeout
+                )
+            if png is not None:
+                screenshot, delay = await loop.run_in_executor(
+                    None, _screenshot_from_capture, 0, png, b"", attempt, retry_count
+                )
+            else:
+                proc = await asyncio.create_subprocess_exec(
+                    *adb_prefix,
+                    "exec-out",
+                    "screencap",
+                    "-p",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    raise
+                screenshot, delay = await loop.run_in_executor(
+                    None,
+                    _screenshot_from_capture,
+                    proc.returncode,
+                    stdout,
+                    stderr,
+                    attempt,
+                    retry_count,
+                )
+        except Exception:
+            # Unexpected error - return non-sensitive fallback
+            screenshot, delay = _retry_or_fallback(attempt, retry_count, 0.2)
+
+        if screenshot is not None:
+            return screenshot
+        await asyncio.sleep(delay)
+
+    # Fallback if all retries exhausted
+    return _create_fallback_screenshot(is_sensitive=False)
+
+
+def _retry_or_fallback(
+    attempt: int, retry_count: int, delay: float, is_sensitive: bool = False
+) -> tuple[Screenshot | None, float]:
+    """Retry after delay, or give up with a fallback on the last attempt."""
+    if attempt < retry_count - 1:
+        return None, delay
+    return _create_fallback_screenshot(is_sensitive=is_sensitive), 0.0
+
+
+def _screenshot_from_capture(
+    returncode: int, png: bytes, stderr: bytes, attempt: int, retry_count: int
+) -> tuple[Screenshot | None, float]:
+    """
+    Turn the output of one `exec-out screencap -p` attempt into a Screenshot.
+
+    Returns:
+        Tuple of (screenshot, retry delay). The screenshot is None when the
+        attempt should be retried after the delay.
+    """
+    stderr_text = stderr.decode("utf-8", "replace")
+
+    # Check for screenshot command failure (return code != 0)
+    if returncode != 0 or not png:
+        print(f"[screenshot.py] Screenshot command failed on attempt {attempt + 1}/{retry_count}: {stderr_text}")
+        # Retry instead of immediately returning fallback
+        if attempt < retry_count - 1:
+            return None, 0.3
+        # Only mark as sensitive if the error explicitly indicates it
+        # (e.g., specific ADB errors related to permissions)
+        is_sensitive_error = _SENSITIVE_ERROR_RE.search(stderr_text) is not None
+        print(f"[screenshot.py] All retries exhausted, returning fallback (is_sensitive={is_sensitive_error})")
+        return _create_fallback_screenshot(is_sensitive=is_sensitive_error), 0.0
+
+    from PIL import Image
+
+    # Read and encode image
+    try:
+        # Image.open only parses the header; pixels are decoded by the black check
+        img = Image.open(BytesIO(png))
+        width, height = img.size
+
+        # Check if the image is mostly black (likely a screenshot failure, not sensitive)
+        if _is_black_image(img):
+            print(f"[screenshot.py] Detected black image on attempt {attempt + 1}/{retry_count}, retrying...")
+            # Retry on black image
+            if attempt < retry_count - 1:
+                return None, 0.2
+            # After all retries, return non-sensitive fallback
+            print(f"[screenshot.py] All {retry_count} retries exhausted for black image, returning fallback")
+            return _create_fallback_screenshot(is_sensitive=False, is_black=True), 0.0
+    except (OSError, IOError):
+        # Image data corrupted or unreadable
+        return _retry_or_fallback(attempt, retry_count, 0.2)
+
+    # screencap already produced a PNG; send its bytes as-is
+    # rather than decoding and re-compressing them
+    base64_data = base64.b64encode(png).decode("ascii")
+
+    return Screenshot(
+        base64_data=base64_data, width=width, height=height, is_sensitive=False
+    ), 0.0
+
+
 def _get_adb_prefix(device_id: str | None) -> list:
     """Get ADB command prefix with optional device specifier."""
+    _ensure_adb_server()
     if device_id:
         return ["adb", "-s", device_id]
     return ["adb"]
 
 
-def _create_fallback_screenshot(is_sensitive: bool) -> Screenshot:
+def _create_fallback_screenshot(is_sensitive: bool, is_black: bool = False) -> Screenshot:
     """Create a black fallback image when screenshot fails."""
     default_width, default_height = 1080, 2400
 
-    black_img = Image.new("RGB", (default_width, default_height), color="black")
-    buffered = BytesIO()
-    black_img.save(buffered, format="PNG")
-    base64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
     return Screenshot(
-        base64_data=base64_data,
+        base64_data=_black_png_base64(default_width, default_height),
         width=default_width,
         height=default_height,
         is_sensitive=is_sensitive,
+        is_black=is_black,
     )
 
 
+@functools.cache
+def _black_png_base64(width: int, height: int) -> str:
+    """Encode a black PNG of the given size once; the result never changes."""
+    from PIL import Image
+
+    black_img = Image.new("RGB", (width, height), color="black")
+    buffered = BytesIO()
+    black_img.save(buffered, format="PNG")
+    return base64.b64encode(buffered.getvalue()).decode("utf-8")
+
+
 def cleanup_device_screenshots(device_id: str | None = None, verbose: bool = False) -> None:
     """
     Clean up temporary screenshot files on the Android device.
 
-    This function removes the temporary screenshot file (/sdcard/tmp.png) that
-    may have been created during agent operation. Uses retry logic and verification.
+    This function removes the temporary screenshot file (/sdcard/tmp.png) left
+    by older versions, which captured to the device before pulling the file.
+    Uses retry logic and verification.
 
     Args:
         device_id: Optional ADB device ID for multi-device setups.
@@ -203,3 +379,17 @@ def cleanup_device_screenshots(device_id: str | None = None, verbose: bool = Fal
     
     if not result.success:
         raise RuntimeError(f"Failed to cleanup device screenshots: {result.message}")
+
+
+async def cleanup_device_screenshots_async(
+    device_id: str | None = None, verbose: bool = False
+) -> None:
+    """
+    Clean up temporary screenshot files without blocking the event loop.
+
+    See cleanup_device_screenshots; the cleanup runs on a worker thread.
+
+    Raises:
+        RuntimeError: If cleanup fails after all retries.
+    """
+    await asyncio.to_thread(cleanup_device_screenshots, device_id, verbose)
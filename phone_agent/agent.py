@@ -1,16 +1,16 @@
 """Main PhoneAgent class for orchestrating phone automation."""
 
-import json
-import traceback
+import asyncio
+import time
 from dataclasses import dataclass
-from typing import Any, Callable, TYPE_CHECKING
+from typing import Callable, TYPE_CHECKING
 
 from phone_agent.actions import ActionHandler
-from phone_agent.actions.handler import do, finish, parse_action
-from phone_agent.config import get_messages, get_system_prompt
+# StepResult is re-exported for callers that import it from here
+from phone_agent.agent_base import StepResult, _BasePhoneAgent
+from phone_agent.config import get_system_prompt
 from phone_agent.device_factory import get_device_factory
 from phone_agent.model import ModelClient, ModelConfig
-from phone_agent.model.client import MessageBuilder
 
 if TYPE_CHECKING:
     from phone_agent.adb.screenshot import Screenshot
@@ -25,6 +25,9 @@ class AgentConfig:
     lang: str = "cn"
     system_prompt: str | None = None
     verbose: bool = True
+    # Keep only the last N step turns in the context sent to the model, plus
+    # the system prompt and the first (task) turn; None keeps the full history
+    max_context_turns: int | None = None
     auto_cleanup_screenshots: bool = True
 
     def __post_init__(self):
@@ -32,18 +35,7 @@ class AgentConfig:
             self.system_prompt = get_system_prompt(self.lang)
 
 
-@dataclass
-class StepResult:
-    """Result of a single agent step."""
-
-    success: bool
-    finished: bool
-    action: dict[str, Any] | None
-    thinking: str
-    message: str | None = None
-
-
-class PhoneAgent:
+class PhoneAgent(_BasePhoneAgent):
     """
     AI-powered agent for automating Android phone interactions.
 
@@ -82,12 +74,15 @@ class PhoneAgent:
             takeover_callback=takeover_callback,
         )
 
-        self._context: list[dict[str, Any]] = []
-        self._step_count = 0
+        self._init_loop_state()
 
-    def run(self, task: str) -> str:
+    async def run_async(self, task: str) -> str:
         """
-        Run the agent to complete a task.
+        Run the agent on a worker thread so several agents can run concurrently.
+
+        Each agent blocks on its own device and model calls, so driving one
+        agent per device with asyncio.gather takes as long as the slowest
+        device rather than the sum of all of them.
 
         Args:
             task: Natural language description of the task.
@@ -95,56 +90,51 @@ class PhoneAgent:
         Returns:
             Final message from the agent.
         """
-        try:
-            # Tier 1: Startup protection - check for and clean stale files
-            if self.agent_config.auto_cleanup_screenshots:
-                self._cleanup_stale_files()
-            
-            self._context = []
-            self._step_count = 0
-
-            # First step with user prompt
-            result = self._execute_step(task, is_first=True)
-
-            if result.finished:
-                return result.message or "Task completed"
-
-            # Continue until finished or max steps reached
-            while self._step_count < self.agent_config.max_steps:
-                result = self._execute_step(is_first=False)
-
-                if result.finished:
-                    return result.message or "Task completed"
-
-            return "Max steps reached"
-        finally:
-            # Tier 3: Final cleanup - ensure files are deleted
-            if self.agent_config.auto_cleanup_screenshots:
-                self._cleanup_device_screenshots()
+        return await asyncio.to_thread(self.run, task)
+
+    def _start_run(self) -> None:
+        """Run Tier 1 cleanup before the first step."""
+        # Startup protection - clean a stale /sdcard/tmp.png left by older
+        # versions; screenshots are now streamed and never written to the device
+        if self.agent_config.auto_cleanup_screenshots:
+            self._cleanup_stale_files()
+
+    def _end_run(self) -> None:
+        """Stop the worker pool and run Tier 3 cleanup, however the run ended."""
+        super()._end_run()
+        # Tier 3: Final cleanup - ensure files are deleted
+        if self.agent_config.auto_cleanup_screenshots:
+            self._cleanup_device_screenshots()
 
-    def step(self, task: str | None = None) -> StepResult:
+    def _cleanup_stale_files(self, max_age_hours: int = 24) -> None:
         """
-        Execute a single step of the agent.
-
-        Useful for manual control or debugging.
-
+        Check for and clean up stale screenshot files from previous failed attempts.
+        
+        This is Tier 1 protection: runs at the start of each task to recover from
+        previous cleanup failures.
+        
         Args:
-            task: Task description (only needed for first step).
-
-        Returns:
-            StepResult with step details.
+            max_age_hours: Only clean files older than this many hours (default: 24).
         """
-        is_first = len(self._context) == 0
-
-        if is_first and not task:
-            raise ValueError("Task is required for the first step")
-
-        return self._execute_step(task, is_first)
-
-    def reset(self) -> None:
-        """Reset the agent state for a new task."""
-        self._context = []
-        self._step_count = 0
+        try:
+            from phone_agent.adb.cleanup import ScreenshotCleanupManager
+            
+            manager = ScreenshotCleanupManager(verbose=False)  # Quiet mode
+            
+            # Existence, age check and removal happen in one device round-trip
+            result = manager.cleanup_stale_files(
+                device_id=self.agent_config.device_id,
+                max_age_hours=max_age_hours,
+            )
+            
+            if self.agent_config.verbose and result.success:
+                if "skipping" not in result.message and "does not exist" not in result.message:
+                    print(f"🧹 {result.message}")
+        
+        except Exception as e:
+            # Silent failure in startup protection - don't interrupt task
+            if self.agent_config.verbose:
+                print(f"⚠️  Failed to check for stale files: {e}")
 
     def _cleanup_device_screenshots(self) -> None:
         """
@@ -173,177 +163,72 @@ class PhoneAgent:
             # Silent failure - log but don't crash
             if self.agent_config.verbose:
                 print(f"⚠️  Failed to cleanup device screenshots: {e}")
-    
-    def _cleanup_stale_files(self, max_age_hours: int = 24) -> None:
-        """
-        Check for and clean up stale screenshot files from previous failed attempts.
-        
-        This is Tier 1 protection: runs at the start of each task to recover from
-        previous cleanup failures.
-        
-        Args:
-            max_age_hours: Only clean files older than this many hours (default: 24).
-        """
-        try:
-            from phone_agent.adb.cleanup import ScreenshotCleanupManager
-            
-            manager = ScreenshotCleanupManager(verbose=False)  # Quiet mode
-            
-            # Check file info
-            file_info = manager.get_file_info(self.agent_config.device_id)
-            
-            if file_info.get("exists"):
-                # File exists - check if it's stale
-                result = manager.cleanup_stale_files(
-                    device_id=self.agent_config.device_id,
-                    max_age_hours=max_age_hours,
-                )
-                
-                if self.agent_config.verbose and result.success:
-                    if "skipping" not in result.message:
-                        print(f"🧹 {result.message}")
-        
-        except Exception as e:
-            # Silent failure in startup protection - don't interrupt task
-            if self.agent_config.verbose:
-                print(f"⚠️  Failed to check for stale files: {e}")
 
-    def _execute_step(
-        self, user_prompt: str | None = None, is_first: bool = False
-    ) -> StepResult:
-        """Execute a single step of the agent loop."""
-        self._step_count += 1
+    def _check_first_screen(
+        self, screenshot: "Screenshot", current_app: str
+    ) -> tuple["Screenshot", str]:
+        """Press Home if the first screen came back black or sensitive."""
+        if screenshot.is_sensitive or self._is_black_image(screenshot):
+            return self._recover_from_black_screen()
+        return screenshot, current_app
 
-        # Capture current screen state
+    def _capture_observation(self) -> tuple["Screenshot", str]:
+        """Capture the screenshot and current app from the device."""
         device_factory = get_device_factory()
-        screenshot = device_factory.get_screenshot(self.agent_config.device_id)
-        current_app = device_factory.get_current_app(self.agent_config.device_id)
-
-        # If we got a black/fallback screenshot on first step, try Home to get to known state
-        if (screenshot.is_sensitive or self._is_black_image(screenshot)) and is_first:
-            if self.agent_config.verbose:
-                print("⚠️  Detected black screen on first step, executing Home to reset...")
-            # Execute Home action silently to get to a known state
-            from phone_agent.adb import home
-            home(self.agent_config.device_id)
-            import time
-            time.sleep(1)
-            # Retry the step
-            return self._execute_step(user_prompt, is_first)
-
-        # Build messages
-        if is_first:
-            self._context.append(
-                MessageBuilder.create_system_message(self.agent_config.system_prompt)
+        if device_factory.batches_screen_state:
+            # One device round-trip for both
+            return device_factory.get_screenshot_and_current_app(
+                self.agent_config.device_id
             )
 
-            screen_info = MessageBuilder.build_screen_info(current_app)
-            text_content = f"{user_prompt}\n\n{screen_info}"
+        # The screenshot and current app are independent device round-trips,
+        # so fetch them concurrently
+        screenshot_future = self._submit(
+            device_factory.get_screenshot, self.agent_config.device_id
+        )
+        current_app = device_factory.get_current_app(self.agent_config.device_id)
+        return screenshot_future.result(), current_app
 
-            self._context.append(
-                MessageBuilder.create_user_message(
-                    text=text_content, image_base64=screenshot.base64_data
-                )
-            )
-        else:
-            screen_info = MessageBuilder.build_screen_info(current_app)
-            text_content = f"** Screen Info **\n\n{screen_info}"
-
-            self._context.append(
-                MessageBuilder.create_user_message(
-                    text=text_content, image_base64=screenshot.base64_data
-                )
-            )
+    def _recover_from_black_screen(
+        self, timeout: float = 2.0
+    ) -> tuple["Screenshot", str]:
+        """
+        Press Home and wait for a usable frame, within the current step.
 
-        # Get model response
-        try:
-            msgs = get_messages(self.agent_config.lang)
-            print("\n" + "=" * 50)
-            print(f"💭 {msgs['thinking']}:")
-            print("-" * 50)
-            response = self.model_client.request(self._context)
-        except Exception as e:
-            if self.agent_config.verbose:
-                traceback.print_exc()
-            return StepResult(
-                success=False,
-                finished=True,
-                action=None,
-                thinking="",
-                message=f"Model error: {e}",
-            )
+        Polls the screen with a growing delay instead of sleeping a fixed
+        time, and does not re-enter _execute_step, so the step is counted once.
 
-        # Parse action from response
-        try:
-            action = parse_action(response.action)
-        except ValueError:
-            if self.agent_config.verbose:
-                traceback.print_exc()
-            action = finish(message=response.action)
+        Args:
+            timeout: Seconds to keep polling before going on with the last frame.
 
+        Returns:
+            Tuple of (screenshot, current app) after the reset.
+        """
         if self.agent_config.verbose:
-            # Print thinking process
-            print("-" * 50)
-            print(f"🎯 {msgs['action']}:")
-            print(json.dumps(action, ensure_ascii=False, indent=2))
-            print("=" * 50 + "\n")
-
-        # Remove image from context to save space
-        self._context[-1] = MessageBuilder.remove_images_from_message(self._context[-1])
-
-        # Execute action
+            print("⚠️  Detected black screen on first step, executing Home to reset...")
+        # Execute Home action silently to get to a known state
+        device_factory = get_device_factory()
         try:
-            result = self.action_handler.execute(
-                action, screenshot.width, screenshot.height
-            )
+            device_factory.home(self.agent_config.device_id, delay=0)
         except Exception as e:
+            # Go on with the frames we can get; the model sees the screen anyway
             if self.agent_config.verbose:
-                traceback.print_exc()
-            result = self.action_handler.execute(
-                finish(message=str(e)), screenshot.width, screenshot.height
-            )
-
-        # Add assistant response to context
-        self._context.append(
-            MessageBuilder.create_assistant_message(
-                f"<think>{response.thinking}</think><answer>{response.action}</answer>"
-            )
-        )
-
-        # Check if finished
-        finished = action.get("_metadata") == "finish" or result.should_finish
-
-        if finished and self.agent_config.verbose:
-            msgs = get_messages(self.agent_config.lang)
-            print("\n" + "🎉 " + "=" * 48)
-            print(
-                f"✅ {msgs['task_completed']}: {result.message or action.get('message', msgs['done'])}"
-            )
-            print("=" * 50 + "\n")
-
-        return StepResult(
-            success=result.success,
-            finished=finished,
-            action=action,
-            thinking=response.thinking,
-            message=result.message or action.get("message"),
-        )
-
-    @property
-    def context(self) -> list[dict[str, Any]]:
-        """Get the current conversation context."""
-        return self._context.copy()
+                print(f"⚠️  Failed to press Home: {e}")
+
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while True:
+            screenshot = device_factory.get_screenshot(self.agent_config.device_id)
+            if not (screenshot.is_sensitive or self._is_black_image(screenshot)):
+                break
+            if time.monotonic() >= deadline:
+                break
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.4)
+        return screenshot, device_factory.get_current_app(self.agent_config.device_id)
 
-    @property
-    def step_count(self) -> int:
-        """Get the current step count."""
-        return self._step_count
     @staticmethod
     def _is_black_image(screenshot: "Screenshot") -> bool:
         """Check if a screenshot appears to be all black (failed screenshot)."""
-        # Check if it's a fallback image by looking at base64 properties
-        # Black images are typically much smaller than real screenshots
-        if not screenshot.base64_data:
-            return True
-        # If the base64 length is very small, it's likely a black placeholder
-        return len(screenshot.base64_data) < 5000
\ No newline at end of file
+        # The capture module already decoded the frame and flagged black ones
+        return not screenshot.base64_data or screenshot.is_black
@@ -0,0 +1,294 @@
+"""Step loop plumbing shared by PhoneAgent and IOSPhoneAgent."""
+
+import json
+import traceback
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from phone_agent.actions.handler import finish, parse_action
+from phone_agent.config import get_messages
+from phone_agent.model.client import MessageBuilder
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library
+    orjson = None
+
+
+def _format_action(action: dict[str, Any]) -> str:
+    """Pretty-print an action for verbose output, with orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(action, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(action, ensure_ascii=False, indent=2)
+
+
+@dataclass
+class StepResult:
+    """Result of a single agent step."""
+
+    success: bool
+    finished: bool
+    action: dict[str, Any] | None
+    thinking: str
+    message: str | None = None
+
+
+class _BasePhoneAgent(ABC):
+    """
+    Step loop and context bookkeeping shared by the agents.
+
+    Subclasses set agent_config, model_client and action_handler, call
+    _init_loop_state() from __init__, and implement _capture_observation.
+    The other underscore hooks have defaults and may be overridden.
+    """
+
+    # Thread name prefix for the agent's worker threads
+    _pool_name = "phone-agent"
+
+    def _init_loop_state(self) -> None:
+        """Set up the per-task state; call once the agent config is set."""
+        self._context: list[dict[str, Any]] = []
+        self._step_count = 0
+        # UI messages for the configured language, looked up once
+        self._msgs = get_messages(self.agent_config.lang)
+        # Device requests that overlap within a step. The pool is created on
+        # first use and shut down when a run ends.
+        self._pool: ThreadPoolExecutor | None = None
+
+    def run(self, task: str) -> str:
+        """
+        Run the agent to complete a task.
+
+        Args:
+            task: Natural language description of the task.
+
+        Returns:
+            Final message from the agent.
+        """
+        try:
+            self._start_run()
+
+            self._context = []
+            self._step_count = 0
+
+            # First step with user prompt
+            result = self._execute_step(task, is_first=True)
+
+            if result.finished:
+                return result.message or "Task completed"
+
+            # Continue until finished or max steps reached
+            while self._step_count < self.agent_config.max_steps:
+                result = self._execute_step(is_first=False)
+
+                if result.finished:
+                    return result.message or "Task completed"
+
+            return "Max steps reached"
+        finally:
+            self._end_run()
+
+    def step(self, task: str | None = None) -> StepResult:
+        """
+        Execute a single step of the agent.
+
+        Useful for manual control or debugging.
+
+        Args:
+            task: Task description (only needed for first step).
+
+        Returns:
+            StepResult with step details.
+        """
+        is_first = len(self._context) == 0
+
+        if is_first and not task:
+            raise ValueError("Task is required for the first step")
+
+        return self._execute_step(task, is_first)
+
+    def reset(self) -> None:
+        """Reset the agent state for a new task."""
+        self._context = []
+        self._step_count = 0
+        self._shutdown_pool()
+
+    def _start_run(self) -> None:
+        """Hook called at the start of run(), before the first step."""
+
+    def _end_run(self) -> None:
+        """Hook called when run() returns or raises."""
+        self._shutdown_pool()
+
+    def _check_first_screen(self, screenshot: Any, current_app: str) -> tuple[Any, str]:
+        """Hook to replace an unusable first-step screen; returns it unchanged."""
+        return screenshot, current_app
+
+    def _print_thinking_header(self) -> None:
+        """Hook called before the model request, which streams the thinking."""
+        print("\n" + "=" * 50)
+        print(f"💭 {self._msgs['thinking']}:")
+        print("-" * 50)
+
+    def _print_thinking(self, thinking: str) -> None:
+        """Hook called with the parsed thinking, before the action is printed."""
+
+    def _execute_step(
+        self, user_prompt: str | None = None, is_first: bool = False
+    ) -> StepResult:
+        """Execute a single step of the agent loop."""
+        self._step_count += 1
+
+        # Capture current screen state
+        screenshot, current_app = self._capture_observation()
+
+        if is_first:
+            screenshot, current_app = self._check_first_screen(screenshot, current_app)
+
+        # Build messages
+        if is_first:
+            self._context.append(
+                MessageBuilder.create_system_message(self.agent_config.system_prompt)
+            )
+
+            screen_info = MessageBuilder.build_screen_info(current_app)
+            text_content = f"{user_prompt}\n\n{screen_info}"
+
+            self._context.append(
+                MessageBuilder.create_user_message(
+                    text=text_content, image_base64=screenshot.base64_data
+                )
+            )
+        else:
+            screen_info = MessageBuilder.build_screen_info(current_app)
+            text_content = f"** Screen Info **\n\n{screen_info}"
+
+            self._context.append(
+                MessageBuilder.create_user_message(
+                    text=text_content, image_base64=screenshot.base64_data
+                )
+            )
+
+        # Only the dimensions are needed from here on; drop the screenshot so
+        # its base64 string is not held alongside the message during the request
+        screen_width, screen_height = screenshot.width, screenshot.height
+        del screenshot
+
+        # Get model response
+        try:
+            self._print_thinking_header()
+            response = self.model_client.request(self._context)
+        except Exception as e:
+            if self.agent_config.verbose:
+                traceback.print_exc()
+            return StepResult(
+                success=False,
+                finished=True,
+                action=None,
+                thinking="",
+                message=f"Model error: {e}",
+            )
+
+        # Parse action from response
+        try:
+            action = parse_action(response.action)
+        except ValueError as e:
+            # An unparsable answer is expected model output, not a bug; the
+            # parser's stack says nothing useful, so report it on one line
+            if self.agent_config.verbose:
+                print(f"⚠️  {e}, finishing with the raw response")
+            action = finish(message=response.action)
+
+        if self.agent_config.verbose:
+            # Print thinking process
+            msgs = self._msgs
+            self._print_thinking(response.thinking)
+            print("-" * 50)
+            print(f"🎯 {msgs['action']}:")
+            print(_format_action(action))
+            print("=" * 50 + "\n")
+
+        # Remove image from context to save space
+        self._context[-1] = MessageBuilder.remove_images_from_message(self._context[-1])
+
+        # Execute action
+        try:
+            result = self.action_handler.execute(
+                action, screen_width, screen_height
+            )
+        except Exception as e:
+            if self.agent_config.verbose:
+                traceback.print_exc()
+            result = self.action_handler.execute(
+                finish(message=str(e)), screen_width, screen_height
+            )
+
+        # Check if finished
+        finished = action.get("_metadata") == "finish" or result.should_finish
+
+        # Add assistant response to context
+        self._context.append(
+            MessageBuilder.create_assistant_message(
+                f"<think>{response.thinking}</think><answer>{response.action}</answer>"
+            )
+        )
+
+        self._prune_context()
+
+        if finished and self.agent_config.verbose:
+            msgs = self._msgs
+            print("\n" + "🎉 " + "=" * 48)
+            print(
+                f"✅ {msgs['task_completed']}: {result.message or action.get('message', msgs['done'])}"
+            )
+            print("=" * 50 + "\n")
+
+        return StepResult(
+            success=result.success,
+            finished=finished,
+            action=action,
+            thinking=response.thinking,
+            message=result.message or action.get("message"),
+        )
+
+    def _submit(self, fn, *args, **kwargs) -> Future:
+        """Run a call on the agent's worker pool, creating the pool if needed."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=self._pool_name
+            )
+        return self._pool.submit(fn, *args, **kwargs)
+
+    def _shutdown_pool(self) -> None:
+        """Stop the worker pool."""
+        if self._pool is not None:
+            # A request already in flight finishes on its own; queued ones are dropped
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    @abstractmethod
+    def _capture_observation(self) -> tuple[Any, str]:
+        """Capture the screenshot and current app from the device."""
+
+    def _prune_context(self) -> None:
+        """Drop the oldest step turns beyond max_context_turns."""
+        max_turns = self.agent_config.max_context_turns
+        if max_turns is None:
+            return
+        # [system, task, first answer, (screen, answer) per later step]; keep
+        # the first turn so the task stays in view and roles still alternate
+        keep = 3 + 2 * max_turns
+        if len(self._context) > keep:
+            del self._context[3 : len(self._context) - 2 * max_turns]
+
+    @property
+    def context(self) -> tuple[dict[str, Any], ...]:
+        """Get a read-only snapshot of the current conversation context."""
+        return tuple(self._context)
+
+    @property
+    def step_count(self) -> int:
+        """Get the current step count."""
+        return self._step_count
@@ -1,15 +1,13 @@
 """iOS PhoneAgent class for orchestrating iOS phone automation."""
 
-import json
-import traceback
 from dataclasses import dataclass
 from typing import Any, Callable
 
-from phone_agent.actions.handler import do, finish, parse_action
 from phone_agent.actions.handler_ios import IOSActionHandler
-from phone_agent.config import get_messages, get_system_prompt
+# StepResult is re-exported for callers that import it from here
+from phone_agent.agent_base import StepResult, _BasePhoneAgent
+from phone_agent.config import get_system_prompt
 from phone_agent.model import ModelClient, ModelConfig
-from phone_agent.model.client import MessageBuilder
 from phone_agent.xctest import XCTestConnection, get_current_app, get_screenshot
 
 
@@ -24,24 +22,16 @@ class IOSAgentConfig:
     lang: str = "cn"
     system_prompt: str | None = None
     verbose: bool = True
+    # Keep only the last N step turns in the context sent to the model, plus
+    # the system prompt and the first (task) turn; None keeps the full history
+    max_context_turns: int | None = None
 
     def __post_init__(self):
         if self.system_prompt is None:
             self.system_prompt = get_system_prompt(self.lang)
 
 
-@dataclass
-class StepResult:
-    """Result of a single agent step."""
-
-    success: bool
-    finished: bool
-    action: dict[str, Any] | None
-    thinking: str
-    message: str | None = None
-
-
-class IOSPhoneAgent:
+class IOSPhoneAgent(_BasePhoneAgent):
     """
     AI-powered agent for automating iOS phone interactions.
 
@@ -53,6 +43,8 @@ class IOSPhoneAgent:
         agent_config: Configuration for the iOS agent behavior.
         confirmation_callback: Optional callback for sensitive action confirmation.
         takeover_callback: Optional callback for takeover requests.
+        wda_connection: Optional existing XCTestConnection to reuse instead of
+            opening a new one for agent_config.wda_url.
 
     Example:
         >>> from phone_agent.agent_ios import IOSPhoneAgent, IOSAgentConfig
@@ -64,12 +56,15 @@ class IOSPhoneAgent:
         >>> agent.run("Open Safari and search for Apple")
     """
 
+    _pool_name = "ios-agent"
+
     def __init__(
         self,
         model_config: ModelConfig | None = None,
         agent_config: IOSAgentConfig | None = None,
         confirmation_callback: Callable[[str], bool] | None = None,
         takeover_callback: Callable[[str], None] | None = None,
+        wda_connection: XCTestConnection | None = None,
     ):
         self.model_config = model_config or ModelConfig()
         self.agent_config = agent_config or IOSAgentConfig()
@@ -77,7 +72,9 @@ class IOSPhoneAgent:
         self.model_client = ModelClient(self.model_config)
 
         # Initialize WDA connection and create session if needed
-        self.wda_connection = XCTestConnection(wda_url=self.agent_config.wda_url)
+        self.wda_connection = wda_connection or XCTestConnection(
+            wda_url=self.agent_config.wda_url
+        )
 
         # Auto-create session if not provided
         if self.agent_config.session_id is None:
@@ -96,69 +93,24 @@ class IOSPhoneAgent:
             takeover_callback=takeover_callback,
         )
 
-        self._context: list[dict[str, Any]] = []
-        self._step_count = 0
-
-    def run(self, task: str) -> str:
-        """
-        Run the agent to complete a task.
-
-        Args:
-            task: Natural language description of the task.
-
-        Returns:
-            Final message from the agent.
-        """
-        self._context = []
-        self._step_count = 0
-
-        # First step with user prompt
-        result = self._execute_step(task, is_first=True)
-
-        if result.finished:
-            return result.message or "Task completed"
-
-        # Continue until finished or max steps reached
-        while self._step_count < self.agent_config.max_steps:
-            result = self._execute_step(is_first=False)
-
-            if result.finished:
-                return result.message or "Task completed"
-
-        return "Max steps reached"
-
-    def step(self, task: str | None = None) -> StepResult:
-        """
-        Execute a single step of the agent.
-
-        Useful for manual control or debugging.
-
-        Args:
-            task: Task description (only needed for first step).
-
-        Returns:
-            StepResult with step details.
-        """
-        is_first = len(self._context) == 0
-
-        if is_first and not task:
-            raise ValueError("Task is required for the first step")
+        self._init_loop_state()
 
-        return self._execute_step(task, is_first)
+    def _print_thinking_header(self) -> None:
+        """Print the thinking with the action instead, once it is parsed."""
 
-    def reset(self) -> None:
-        """Reset the agent state for a new task."""
-        self._context = []
-        self._step_count = 0
+    def _print_thinking(self, thinking: str) -> None:
+        """Print the parsed thinking ahead of the action."""
+        print("\n" + "=" * 50)
+        print(f"💭 {self._msgs['thinking']}:")
+        print("-" * 50)
+        print(thinking)
 
-    def _execute_step(
-        self, user_prompt: str | None = None, is_first: bool = False
-    ) -> StepResult:
-        """Execute a single step of the agent loop."""
-        self._step_count += 1
-
-        # Capture current screen state
-        screenshot = get_screenshot(
+    def _capture_observation(self) -> tuple[Any, str]:
+        """Fetch the screenshot and current app from WebDriverAgent."""
+        # The screenshot and current app are independent WDA requests,
+        # so fetch them concurrently
+        screenshot_future = self._submit(
+            get_screenshot,
             wda_url=self.agent_config.wda_url,
             session_id=self.agent_config.session_id,
             device_id=self.agent_config.device_id,
@@ -166,112 +118,4 @@ class IOSPhoneAgent:
         current_app = get_current_app(
             wda_url=self.agent_config.wda_url, session_id=self.agent_config.session_id
         )
-
-        # Build messages
-        if is_first:
-            self._context.append(
-                MessageBuilder.create_system_message(self.agent_config.system_prompt)
-            )
-
-            screen_info = MessageBuilder.build_screen_info(current_app)
-            text_content = f"{user_prompt}\n\n{screen_info}"
-
-            self._context.append(
-                MessageBuilder.create_user_message(
-                    text=text_content, image_base64=screenshot.base64_data
-                )
-            )
-        else:
-            screen_info = MessageBuilder.build_screen_info(current_app)
-            text_content = f"** Screen Info **\n\n{screen_info}"
-
-            self._context.append(
-                MessageBuilder.create_user_message(
-                    text=text_content, image_base64=screenshot.base64_data
-                )
-            )
-
-        # Get model response
-        try:
-            response = self.model_client.request(self._context)
-        except Exception as e:
-            if self.agent_config.verbose:
-                traceback.print_exc()
-            return StepResult(
-                success=False,
-                finished=True,
-                action=None,
-                thinking="",
-                message=f"Model error: {e}",
-            )
-
-        # Parse action from response
-        try:
-            action = parse_action(response.action)
-        except ValueError:
-            if self.agent_config.verbose:
-                traceback.print_exc()
-            action = finish(message=response.action)
-
-        if self.agent_config.verbose:
-            # Print thinking process
-            msgs = get_messages(self.agent_config.lang)
-            print("\n" + "=" * 50)
-            print(f"💭 {msgs['thinking']}:")
-            print("-" * 50)
-            print(response.thinking)
-            print("-" * 50)
-            print(f"🎯 {msgs['action']}:")
-            print(json.dumps(action, ensure_ascii=False, indent=2))
-            print("=" * 50 + "\n")
-
-        # Remove image from context to save space
-        self._context[-1] = MessageBuilder.remove_images_from_message(self._context[-1])
-
-        # Execute action
-        try:
-            result = self.action_handler.execute(
-                action, screenshot.width, screenshot.height
-            )
-        except Exception as e:
-            if self.agent_config.verbose:
-                traceback.print_exc()
-            result = self.action_handler.execute(
-                finish(message=str(e)), screenshot.width, screenshot.height
-            )
-
-        # Add assistant response to context
-        self._context.append(
-            MessageBuilder.create_assistant_message(
-                f"<think>{response.thinking}</think><answer>{response.action}</answer>"
-            )
-        )
-
-        # Check if finished
-        finished = action.get("_metadata") == "finish" or result.should_finish
-
-        if finished and self.agent_config.verbose:
-            msgs = get_messages(self.agent_config.lang)
-            print("\n" + "🎉 " + "=" * 48)
-            print(
-                f"✅ {msgs['task_completed']}: {result.message or action.get('message', msgs['done'])}"
-            )
-            print("=" * 50 + "\n")
-
-        return StepResult(
-            success=result.success,
-            finished=finished,
-            action=action,
-            thinking=response.thinking,
-            message=result.message or action.get("message"),
-        )
-
-    @property
-    def context(self) -> list[dict[str, Any]]:
-        """Get the current conversation context."""
-        return self._context.copy()
-
-    @property
-    def step_count(self) -> int:
-        """Get the current step count."""
-        return self._step_count
+        return screenshot_future.result(), current_app
@@ -5,9 +5,9 @@ This module provides test utilities and configurations for validating
 the Douyin coins earning prompt and automation workflows.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any
+from typing import Dict, Any, Tuple
 
 
 class DouyinTask(Enum):
@@ -31,7 +31,7 @@ class TaskDifficulty(Enum):
     HARD = "hard"  # Requires significant user intervention
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DouyinCoinsTask:
     """Configuration for a single coins earning task."""
     
@@ -42,122 +42,91 @@ class DouyinCoinsTask:
     estimated_time_seconds: int  # Expected time in seconds
     difficulty: TaskDifficulty
     automation_support: float  # 0-1, automation percentage
-    prerequisites: List[str] = None  # Tasks that should be done first
+    prerequisites: Tuple[str, ...] = ()  # Tasks that should be done first
     retry_count: int = 3  # Number of retries if failed
     
-    def __post_init__(self):
-        if self.prerequisites is None:
-            self.prerequisites = []
+    def resolve_prerequisites(self) -> Tuple["DouyinCoinsTask", ...]:
+        """Get the task configurations this task's prerequisites refer to."""
+        # DouyinTask(value) is a dict lookup in the enum's value map
+        return tuple(DOUYIN_COINS_TASKS[DouyinTask(name)] for name in self.prerequisites)
+
 
+# Standard Douyin coins earning tasks, one row per task in field order:
+# (task type, name, description, estimated coins, estimated seconds, difficulty,
+#  automation support, prerequisites, retry count)
+_TASK_SPECS = (
+    # 5 minutes, 100% automation support
+    (DouyinTask.WATCH_VIDEOS, "刷视频", "在推荐视频流中浏览视频",
+     20, 300, TaskDifficulty.EASY, 1.0, (), 1),
+    # 95% automation support
+    (DouyinTask.DAILY_SIGNIN, "每日签到", "完成每日登录签到任务",
+     30, 30, TaskDifficulty.EASY, 0.95, (), 2),
+    # 2 minutes, 90% automation support
+    (DouyinTask.WATCH_ADS, "看广告", "观看推荐的广告视频",
+     15, 120, TaskDifficulty.EASY, 0.9, (), 3),
+    # 70% automation support
+    (DouyinTask.SHARE_VIDEO, "分享视频", "分享视频到其他平台",
+     25, 60, TaskDifficulty.MEDIUM, 0.7, (), 3),
+    # 60% automation support
+    (DouyinTask.COMMENT_VIDEO, "评论视频", "在视频下发表评论",
+     10, 45, TaskDifficulty.MEDIUM, 0.6, ("watch_videos",), 3),
+    # 100% automation support
+    (DouyinTask.LIKE_VIDEO, "点赞视频", "对视频点赞",
+     5, 20, TaskDifficulty.EASY, 1.0, (), 1),
+    # 0% automation support (requires manual)
+    (DouyinTask.INVITE_FRIENDS, "邀请好友", "邀请好友注册并完成指定操作",
+     100, 300, TaskDifficulty.HARD, 0.0, (), 1),
+    # 50% automation support
+    (DouyinTask.PARTICIPATE_ACTIVITY, "参与活动", "参与限时活动赚取额外金币",
+     50, 600, TaskDifficulty.MEDIUM, 0.5, (), 2),
+)
 
-# Standard Douyin coins earning tasks
 DOUYIN_COINS_TASKS: Dict[DouyinTask, DouyinCoinsTask] = {
-    DouyinTask.WATCH_VIDEOS: DouyinCoinsTask(
-        task_type=DouyinTask.WATCH_VIDEOS,
-        name="刷视频",
-        description="在推荐视频流中浏览视频",
-        estimated_coins=20,
-        estimated_time_seconds=300,  # 5 minutes
-        difficulty=TaskDifficulty.EASY,
-        automation_support=1.0,  # 100% automation support
-        retry_count=1
-    ),
-    DouyinTask.DAILY_SIGNIN: DouyinCoinsTask(
-        task_type=DouyinTask.DAILY_SIGNIN,
-        name="每日签到",
-        description="完成每日登录签到任务",
-        estimated_coins=30,
-        estimated_time_seconds=30,
-        difficulty=TaskDifficulty.EASY,
-        automation_support=0.95,  # 95% automation support
-        retry_count=2
-    ),
-    DouyinTask.WATCH_ADS: DouyinCoinsTask(
-        task_type=DouyinTask.WATCH_ADS,
-        name="看广告",
-        description="观看推荐的广告视频",
-        estimated_coins=15,
-        estimated_time_seconds=120,  # 2 minutes
-        difficulty=TaskDifficulty.EASY,
-        automation_support=0.9,  # 90% automation support
-        retry_count=3
-    ),
-    DouyinTask.SHARE_VIDEO: DouyinCoinsTask(
-        task_type=DouyinTask.SHARE_VIDEO,
-        name="分享视频",
-        description="分享视频到其他平台",
-        estimated_coins=25,
-        estimated_time_seconds=60,
-        difficulty=TaskDifficulty.MEDIUM,
-        automation_support=0.7,  # 70% automation support
-        retry_count=3
-    ),
-    DouyinTask.COMMENT_VIDEO: DouyinCoinsTask(
-        task_type=DouyinTask.COMMENT_VIDEO,
-        name="评论视频",
-        description="在视频下发表评论",
-        estimated_coins=10,
-        estimated_time_seconds=45,
-        difficulty=TaskDifficulty.MEDIUM,
-        automation_support=0.6,  # 60% automation support
-        prerequisites=["watch_videos"],
-        retry_count=3
-    ),
-    DouyinTask.LIKE_VIDEO: DouyinCoinsTask(
-        task_type=DouyinTask.LIKE_VIDEO,
-        name="点赞视频",
-        description="对视频点赞",
-        estimated_coins=5,
-        estimated_time_seconds=20,
-        difficulty=TaskDifficulty.EASY,
-        automation_support=1.0,  # 100% automation support
-        retry_count=1
-    ),
-    DouyinTask.INVITE_FRIENDS: DouyinCoinsTask(
-        task_type=DouyinTask.INVITE_FRIENDS,
-        name="邀请好友",
-        description="邀请好友注册并完成指定操作",
-        estimated_coins=100,
-        estimated_time_seconds=300,
-        difficulty=TaskDifficulty.HARD,
-        automation_support=0.0,  # 0% automation support (requires manual)
-        retry_count=1
-    ),
-    DouyinTask.PARTICIPATE_ACTIVITY: DouyinCoinsTask(
-        task_type=DouyinTask.PARTICIPATE_ACTIVITY,
-        name="参与活动",
-        description="参与限时活动赚取额外金币",
-        estimated_coins=50,
-        estimated_time_seconds=600,
-        difficulty=TaskDifficulty.MEDIUM,
-        automation_support=0.5,  # 50% automation support
-        retry_count=2
-    )
+    spec[0]: DouyinCoinsTask(*spec) for spec in _TASK_SPECS
 }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class DouyinSession:
     """A single session of Douyin coins earning."""
     
     session_id: str
-    tasks: List[DouyinCoinsTask]
+    tasks: Tuple[DouyinCoinsTask, ...]
     target_coins: int
     max_duration_seconds: int
     
+    # Aggregates over the tasks, computed once since sessions are immutable
+    _total_coins: int = field(init=False, repr=False, compare=False)
+    _total_time: int = field(init=False, repr=False, compare=False)
+    _avg_auto: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        tasks = tuple(self.tasks)
+        
+        # One pass over the tasks for all three aggregates
+        total_coins = total_time = 0
+        total_auto = 0.0
+        for task in tasks:
+            total_coins += task.estimated_coins
+            total_time += task.estimated_time_seconds
+            total_auto += task.automation_support
+        
+        object.__setattr__(self, "tasks", tasks)
+        object.__setattr__(self, "_total_coins", total_coins)
+        object.__setattr__(self, "_total_time", total_time)
+        object.__setattr__(self, "_avg_auto", total_auto / len(tasks) if tasks else 0.0)
+    
     def total_estimated_coins(self) -> int:
         """Calculate total estimated coins from all tasks."""
-        return sum(task.estimated_coins for task in self.tasks)
+        return self._total_coins
     
     def total_estimated_time(self) -> int:
         """Calculate total estimated time for all tasks."""
-        return sum(task.estimated_time_seconds for task in self.tasks)
+        return self._total_time
     
     def average_automation_support(self) -> float:
         """Calculate average automation support percentage."""
-        if not self.tasks:
-            return 0.0
-        return sum(task.automation_support for task in self.tasks) / len(self.tasks)
+        return self._avg_auto
     
     def is_feasible(self) -> tuple[bool, str]:
         """
@@ -166,66 +135,75 @@ class DouyinSession:
         Returns:
             (is_feasible, reason)
         """
-        estimated_time = self.total_estimated_time()
+        estimated_time = self._total_time
         
         if estimated_time > self.max_duration_seconds:
             return False, f"估计时间 {estimated_time}s 超过限制 {self.max_duration_seconds}s"
         
-        estimated_coins = self.total_estimated_coins()
+        estimated_coins = self._total_coins
         if estimated_coins < self.target_coins:
             return False, f"估计金币 {estimated_coins} 低于目标 {self.target_coins}"
         
-        automation_support = self.average_automation_support()
+        automation_support = self._avg_auto
         if automation_support < 0.5:
             return False, f"自动化支持度 {automation_support:.1%} 太低"
         
         return True, "可行性检查通过"
 
 
+# Tasks shared by the test scenarios
+_SIGNIN = DOUYIN_COINS_TASKS[DouyinTask.DAILY_SIGNIN]
+_ADS = DOUYIN_COINS_TASKS[DouyinTask.WATCH_ADS]
+_VIDEOS = DOUYIN_COINS_TASKS[DouyinTask.WATCH_VIDEOS]
+_LIKE = DOUYIN_COINS_TASKS[DouyinTask.LIKE_VIDEO]
+_SHARE = DOUYIN_COINS_TASKS[DouyinTask.SHARE_VIDEO]
+_ACTIVITY = DOUYIN_COINS_TASKS[DouyinTask.PARTICIPATE_ACTIVITY]
+
+
 # Test scenarios
 TEST_SCENARIOS: Dict[str, DouyinSession] = {
     "quick_session": DouyinSession(
         session_id="quick_session",
-        tasks=[
-            DOUYIN_COINS_TASKS[DouyinTask.DAILY_SIGNIN],
-            DOUYIN_COINS_TASKS[DouyinTask.WATCH_VIDEOS],
-        ],
+        tasks=(
+            _SIGNIN,
+            _VIDEOS,
+        ),
         target_coins=50,
         max_duration_seconds=600  # 10 minutes
     ),
     "extended_session": DouyinSession(
         session_id="extended_session",
-        tasks=[
-            DOUYIN_COINS_TASKS[DouyinTask.DAILY_SIGNIN],
-            DOUYIN_COINS_TASKS[DouyinTask.WATCH_ADS],
-            DOUYIN_COINS_TASKS[DouyinTask.WATCH_VIDEOS],
-            DOUYIN_COINS_TASKS[DouyinTask.LIKE_VIDEO],
-        ],
+        tasks=(
+            _SIGNIN,
+            _ADS,
+            _VIDEOS,
+            _LIKE,
+        ),
         target_coins=100,
         max_duration_seconds=1200  # 20 minutes
     ),
     "premium_session": DouyinSession(
         session_id="premium_session",
-        tasks=[
-            DOUYIN_COINS_TASKS[DouyinTask.DAILY_SIGNIN],
-            DOUYIN_COINS_TASKS[DouyinTask.WATCH_ADS],
-            DOUYIN_COINS_TASKS[DouyinTask.WATCH_VIDEOS],
-            DOUYIN_COINS_TASKS[DouyinTask.LIKE_VIDEO],
-            DOUYIN_COINS_TASKS[DouyinTask.SHARE_VIDEO],
-        ],
+        tasks=(
+            _SIGNIN,
+            _ADS,
+            _VIDEOS,
+            _LIKE,
+            _SHARE,
+        ),
         target_coins=200,
         max_duration_seconds=1800  # 30 minutes
     ),
     "aggressive_session": DouyinSession(
         session_id="aggressive_session",
-        tasks=[
-            DOUYIN_COINS_TASKS[DouyinTask.DAILY_SIGNIN],
-            DOUYIN_COINS_TASKS[DouyinTask.WATCH_ADS],
-            DOUYIN_COINS_TASKS[DouyinTask.WATCH_VIDEOS],
-            DOUYIN_COINS_TASKS[DouyinTask.LIKE_VIDEO],
-            DOUYIN_COINS_TASKS[DouyinTask.SHARE_VIDEO],
-            DOUYIN_COINS_TASKS[DouyinTask.PARTICIPATE_ACTIVITY],
-        ],
+        tasks=(
+            _SIGNIN,
+            _ADS,
+            _VIDEOS,
+            _LIKE,
+            _SHARE,
+            _ACTIVITY,
+        ),
         target_coins=350,
         max_duration_seconds=2400  # 40 minutes
     )
@@ -267,40 +245,68 @@ PROMPT_TEST_CASES = [
 ]
 
 
+# Report templates, formatted once per task or session
+_TASK_SUMMARY_TEMPLATE = "\n".join([
+    "\n【{name}】",
+    "  描述: {description}",
+    "  预期金币: {estimated_coins} 💰",
+    "  预期时间: {estimated_time_seconds}s ⏱️",
+    "  难度: {difficulty}",
+    "  自动化支持: {automation_support:.0%}",
+    "  重试次数: {retry_count}",
+])
+_SESSION_FEASIBILITY_TEMPLATE = "\n".join([
+    "\n【{session_id}】{status}",
+    "  目标金币: {target_coins}",
+    "  预期金币: {estimated_coins}",
+    "  预期时间: {estimated_time}s / 限制: {max_duration_seconds}s",
+    "  自动化支持: {automation_support:.0%}",
+    "  原因: {reason}",
+])
+
+
 def print_task_summary():
     """Print summary of all available tasks."""
-    print("=" * 80)
-    print("抖音赚金币任务概览")
-    print("=" * 80)
+    # Collected first and printed in one write
+    lines = ["=" * 80, "抖音赚金币任务概览", "=" * 80]
     
     for task_type, task_config in DOUYIN_COINS_TASKS.items():
-        print(f"\n【{task_config.name}】")
-        print(f"  描述: {task_config.description}")
-        print(f"  预期金币: {task_config.estimated_coins} 💰")
-        print(f"  预期时间: {task_config.estimated_time_seconds}s ⏱️")
-        print(f"  难度: {task_config.difficulty.value}")
-        print(f"  自动化支持: {task_config.automation_support:.0%}")
-        print(f"  重试次数: {task_config.retry_count}")
+        lines.append(_TASK_SUMMARY_TEMPLATE.format(
+            name=task_config.name,
+            description=task_config.description,
+            estimated_coins=task_config.estimated_coins,
+            estimated_time_seconds=task_config.estimated_time_seconds,
+            difficulty=task_config.difficulty.value,
+            automation_support=task_config.automation_support,
+            retry_count=task_config.retry_count,
+        ))
         if task_config.prerequisites:
-            print(f"  前置条件: {', '.join(task_config.prerequisites)}")
+            lines.append(f"  前置条件: {', '.join(task_config.prerequisites)}")
+    
+    print("\n".join(lines))
 
 
 def print_session_feasibility():
     """Print feasibility analysis for all test scenarios."""
-    print("=" * 80)
-    print("会话可行性分析")
-    print("=" * 80)
+    # Collected first and printed in one write
+    lines = ["=" * 80, "会话可行性分析", "=" * 80]
     
     for session_id, session in TEST_SCENARIOS.items():
         feasible, reason = session.is_feasible()
         status = "✅ 可行" if feasible else "❌ 不可行"
         
-        print(f"\n【{session_id}】{status}")
-        print(f"  目标金币: {session.target_coins}")
-        print(f"  预期金币: {session.total_estimated_coins()}")
-        print(f"  预期时间: {session.total_estimated_time()}s / 限制: {session.max_duration_seconds}s")
-        print(f"  自动化支持: {session.average_automation_support():.0%}")
-        print(f"  原因: {reason}")
+        lines.append(_SESSION_FEASIBILITY_TEMPLATE.format(
+            session_id=session_id,
+            status=status,
+            target_coins=session.target_coins,
+            estimated_coins=session.total_estimated_coins(),
+            estimated_time=session.total_estimated_time(),
+            max_duration_seconds=session.max_duration_seconds,
+            automation_support=session.average_automation_support(),
+            reason=reason,
+        ))
+    
+    print("\n".join(lines))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,8 @@
 """Internationalization (i18n) module for Phone Agent UI messages."""
 
+from types import MappingProxyType
+from typing import Mapping
+
 # Chinese messages
 MESSAGES_ZH = {
     "thinking": "思考过程",
@@ -63,7 +66,15 @@ MESSAGES_EN = {
 }
 
 
-def get_messages(lang: str = "cn") -> dict:
+# Read-only views of the message tables by language code; unknown codes use Chinese
+_TABLES = {
+    "cn": MappingProxyType(MESSAGES_ZH),
+    "en": MappingProxyType(MESSAGES_EN),
+}
+_DEFAULT_TABLE = _TABLES["cn"]
+
+
+def get_messages(lang: str = "cn") -> Mapping[str, str]:
     """
     Get UI messages dictionary by language.
 
@@ -71,11 +82,9 @@ def get_messages(lang: str = "cn") -> dict:
         lang: Language code, 'cn' for Chinese, 'en' for English.
 
     Returns:
-        Dictionary of UI messages.
+        Read-only mapping of UI messages, shared by all callers.
     """
-    if lang == "en":
-        return MESSAGES_EN
-    return MESSAGES_ZH
+    return _TABLES.get(lang, _DEFAULT_TABLE)
 
 
 def get_message(key: str, lang: str = "cn") -> str:
@@ -89,5 +98,4 @@ def get_message(key: str, lang: str = "cn") -> str:
     Returns:
         Message string.
     """
-    messages = get_messages(lang)
-    return messages.get(key, key)
+    return _TABLES.get(lang, _DEFAULT_TABLE).get(key, key)
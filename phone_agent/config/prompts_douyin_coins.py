@@ -4,17 +4,13 @@ This prompt guides the AI agent to browse Douyin videos, interact with content,
 and earn coins through various in-app activities.
 """
 
-from datetime import datetime
+import functools
+from datetime import date
 
-today = datetime.today()
-weekday_names = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
-weekday = weekday_names[today.weekday()]
-formatted_date = today.strftime("%Y年%m月%d日") + " " + weekday
+_WEEKDAY_NAMES = ["星期一", "星期二", "星期三", "星期四", "星期五", "星期六", "星期日"]
 
-DOUYIN_COINS_PROMPT = (
-    "今天的日期是: "
-    + formatted_date
-    + """
+# Prompt body; the current date is prepended when the prompt is requested
+_PROMPT_TEMPLATE = """
 你是一个智能体分析专家，专门用于在抖音(Douyin)平台上赚取金币。你可以根据操作历史和当前状态截图执行一系列操作来完成赚金币任务。
 
 你必须严格按照要求输出以下格式：
@@ -89,9 +85,19 @@ DOUYIN_COINS_PROMPT = (
 3. 进入个人资料页面查找相关入口
 4. 尝试通过搜索功能搜索"赚金币"
 """
-)
 
 
 def get_douyin_coins_prompt() -> str:
-    """Get the Douyin coins earning prompt."""
-    return DOUYIN_COINS_PROMPT
+    """Get the Douyin coins earning prompt, dated today."""
+    return _build_prompt(date.today().toordinal())
+
+
+@functools.lru_cache(maxsize=1)
+def _build_prompt(day: int) -> str:
+    """Build the prompt for a day, given as a proleptic Gregorian ordinal."""
+    today = date.fromordinal(day)
+    formatted_date = (
+        f"{today.year}年{today.month:02d}月{today.day:02d}日 "
+        f"{_WEEKDAY_NAMES[today.weekday()]}"
+    )
+    return "".join(("今天的日期是: ", formatted_date, _PROMPT_TEMPLATE))
@@ -5,6 +5,9 @@ This module provides simplified prompts for single-task focus,
 designed to work with limited AI capabilities.
 """
 
+from typing import Callable
+
+
 def get_simplified_watch_video_prompt() -> str:
     """
     Simplified prompt: Watch videos completely.
@@ -298,6 +301,16 @@ do(action="Wait", duration="1 second")  # 等待页面加载
 """
 
 
+# Prompt builder for each task type accepted by get_focused_task_prompt
+_TASK_PROMPTS: dict[str, Callable[[], str]] = {
+    "watch_video": get_simplified_watch_video_prompt,
+    "watch_ad": get_simplified_watch_ad_prompt,
+    "daily_checkin": get_simplified_daily_checkin_prompt,
+    "simple_task": get_simplified_simple_task_prompt,
+    "navigate_to_earn": get_simplified_earn_coins_home_prompt,
+}
+
+
 def get_focused_task_prompt(task_type: str, details: str = "") -> str:
     """
     Get a focused prompt for a specific task.
@@ -310,16 +323,5 @@ def get_focused_task_prompt(task_type: str, details: str = "") -> str:
     Returns:
         Optimized prompt for the specific task
     """
-    if task_type == "watch_video":
-        return get_simplified_watch_video_prompt()
-    elif task_type == "watch_ad":
-        return get_simplified_watch_ad_prompt()
-    elif task_type == "daily_checkin":
-        return get_simplified_daily_checkin_prompt()
-    elif task_type == "simple_task":
-        return get_simplified_simple_task_prompt()
-    elif task_type == "navigate_to_earn":
-        return get_simplified_earn_coins_home_prompt()
-    else:
-        # Default to watch video
-        return get_simplified_watch_video_prompt()
+    # Unknown task types default to watch video
+    return _TASK_PROMPTS.get(task_type, get_simplified_watch_video_prompt)()
@@ -53,6 +53,19 @@ class DeviceFactory:
         """Get current app name."""
         return self.module.get_current_app(device_id)
 
+    @property
+    def batches_screen_state(self) -> bool:
+        """Whether get_screenshot_and_current_app takes a single round-trip."""
+        return hasattr(self.module, "get_screenshot_and_current_app")
+
+    def get_screenshot_and_current_app(
+        self, device_id: str | None = None, timeout: int = 10
+    ):
+        """Get screenshot and current app name, batched where supported."""
+        if self.batches_screen_state:
+            return self.module.get_screenshot_and_current_app(device_id, timeout)
+        return self.get_screenshot(device_id, timeout), self.get_current_app(device_id)
+
     def tap(
         self, x: int, y: int, device_id: str | None = None, delay: float | None = None
     ):
@@ -2,16 +2,22 @@
 
 import base64
 import os
+import re
 import subprocess
 import tempfile
-import uuid
 from dataclasses import dataclass
 from io import BytesIO
 from typing import Tuple
 
 from PIL import Image
+# The black-frame check is the same for every platform's PIL image
+from phone_agent.adb.screenshot import _is_black_image
 from phone_agent.hdc.connection import _run_hdc_command
 
+# Output of the screenshot commands that means the capture did not happen
+_SCREENSHOT_FAILED_RE = re.compile(r"fail|error|not found", re.IGNORECASE)
+_SNAPSHOT_FAILED_RE = re.compile(r"fail|error", re.IGNORECASE)
+
 
 @dataclass
 class Screenshot:
@@ -21,6 +27,7 @@ class Screenshot:
     width: int
     height: int
     is_sensitive: bool = False
+    is_black: bool = False  # Device kept returning black frames
 
 
 def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screenshot:
@@ -38,7 +45,8 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
         If the screenshot fails (e.g., on sensitive screens like payment pages),
         a black fallback image is returned with is_sensitive=True.
     """
-    temp_path = os.path.join(tempfile.gettempdir(), f"screenshot_{uuid.uuid4()}.png")
+    fd, temp_path = tempfile.mkstemp(suffix=".png")
+    os.close(fd)
     hdc_prefix = _get_hdc_prefix(device_id)
 
     try:
@@ -56,7 +64,7 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
 
         # Check for screenshot failure (sensitive screen)
         output = result.stdout + result.stderr
-        if "fail" in output.lower() or "error" in output.lower() or "not found" in output.lower():
+        if _SCREENSHOT_FAILED_RE.search(output):
             # Try method 2: snapshot_display (older versions or different devices)
             result = _run_hdc_command(
                 hdc_prefix + ["shell", "snapshot_display", "-f", remote_path],
@@ -65,7 +73,7 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
                 timeout=timeout,
             )
             output = result.stdout + result.stderr
-            if "fail" in output.lower() or "error" in output.lower():
+            if _SNAPSHOT_FAILED_RE.search(output):
                 return _create_fallback_screenshot(is_sensitive=True)
 
         # Pull screenshot to local temp path
@@ -77,29 +85,38 @@ def get_screenshot(device_id: str | None = None, timeout: int = 10) -> Screensho
             timeout=5,
         )
 
-        if not os.path.exists(temp_path):
+        if os.path.getsize(temp_path) == 0:
             return _create_fallback_screenshot(is_sensitive=False)
 
         # Read JPEG image and convert to PNG for model inference
         # PIL automatically detects the image format from file content
-        img = Image.open(temp_path)
-        width, height = img.size
+        with Image.open(temp_path) as img:
+            width, height = img.size
+            is_black = _is_black_image(img)
 
-        buffered = BytesIO()
-        img.save(buffered, format="PNG")
+            buffered = BytesIO()
+            img.save(buffered, format="PNG")
         base64_data = base64.b64encode(buffered.getvalue()).decode("utf-8")
 
-        # Cleanup
-        os.remove(temp_path)
-
         return Screenshot(
-            base64_data=base64_data, width=width, height=height, is_sensitive=False
+            base64_data=base64_data,
+            width=width,
+            height=height,
+            is_sensitive=False,
+            is_black=is_black,
         )
 
     except Exception as e:
         print(f"Screenshot error: {e}")
         return _create_fallback_screenshot(is_sensitive=False)
 
+    finally:
+        # Cleanup on every path, including fallbacks and errors
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+
 
 def _get_hdc_prefix(device_id: str | None) -> list:
     """Get HDC command prefix with optional device specifier."""
@@ -122,4 +139,5 @@ def _create_fallback_screenshot(is_sensitive: bool) -> Screenshot:
         width=default_width,
         height=default_height,
         is_sensitive=is_sensitive,
+        is_black=True,
     )
@@ -0,0 +1,100 @@
+"""Interactive task loop shared by the main.py and ios.py CLIs."""
+
+import os
+import threading
+from typing import Any, Callable
+
+
+def create_prompt_session(history_path: str):
+    """
+    Create a prompt_toolkit session with persistent task history.
+
+    Args:
+        history_path: File to keep the task history in.
+
+    Returns:
+        A PromptSession, or None if prompt_toolkit is not installed. In that
+        case readline is loaded, where available, to give input() line editing.
+    """
+    try:
+        from prompt_toolkit import PromptSession
+        from prompt_toolkit.history import FileHistory
+    except ImportError:
+        try:
+            import readline  # noqa: F401
+        except ImportError:
+            pass
+        return None
+
+    try:
+        os.makedirs(os.path.dirname(history_path), exist_ok=True)
+        return PromptSession(history=FileHistory(history_path))
+    except OSError:
+        return PromptSession()
+
+
+class _Warmup:
+    """Runs model_client.warmup on a daemon thread, one call at a time."""
+
+    def __init__(self, model_client: Any):
+        self._model_client = model_client
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start a warmup unless the previous one is still running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(
+            target=self._model_client.warmup, name="model-warmup", daemon=True
+        )
+        self._thread.start()
+
+
+def run_interactive(
+    agent: Any,
+    history_path: str,
+    on_error: Callable[[Exception], None] | None = None,
+) -> None:
+    """
+    Read tasks from the user and run them until they quit.
+
+    The loop and the agent run on the calling thread, so Ctrl+C stops a
+    running task right away. While the user types a task, the model client's
+    connection is warmed up in the background so the first request skips
+    connection setup.
+
+    Args:
+        agent: PhoneAgent or IOSPhoneAgent to run the tasks with.
+        history_path: File to keep the task history in.
+        on_error: Optional callback for an exception raised by a task.
+    """
+    session = create_prompt_session(history_path)
+    read_line = session.prompt if session is not None else input
+    warmup = _Warmup(agent.model_client)
+    warmup.start()
+
+    while True:
+        try:
+            task = read_line("Enter your task: ").strip()
+
+            if task.lower() in ("quit", "exit", "q"):
+                print("Goodbye!")
+                break
+
+            if not task:
+                continue
+
+            print()
+            result = agent.run(task)
+            print(f"\nResult: {result}\n")
+            agent.reset()
+            # The connection may go idle while the user types the next task
+            warmup.start()
+
+        except (KeyboardInterrupt, EOFError):
+            print("\n\nInterrupted. Goodbye!")
+            break
+        except Exception as e:
+            if on_error is not None:
+                on_error(e)
+            print(f"\nError: {e}\n")
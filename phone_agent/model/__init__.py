@@ -1,5 +1,5 @@
 """Model client module for AI inference."""
 
-from phone_agent.model.client import ModelClient, ModelConfig
+from phone_agent.model.client import ModelClient, ModelConfig, get_shared_http_client
 
-__all__ = ["ModelClient", "ModelConfig"]
+__all__ = ["ModelClient", "ModelConfig", "get_shared_http_client"]
@@ -1,13 +1,15 @@
 """Model client for AI inference using OpenAI-compatible API."""
 
+import functools
 import json
+import threading
 import time
 from dataclasses import dataclass, field
 from typing import Any
 
-from openai import OpenAI
+from openai import DefaultHttpxClient, OpenAI
 
-from phone_agent.config.i18n import get_message
+from phone_agent.config.i18n import get_messages
 
 
 @dataclass
@@ -23,6 +25,12 @@ class ModelConfig:
     frequency_penalty: float = 0.2
     extra_body: dict[str, Any] = field(default_factory=dict)
     lang: str = "cn"  # Language for UI messages: 'cn' or 'en'
+    # Sent as prompt_cache_key when set, so servers that support prefix
+    # caching can reuse the system prompt across steps
+    prompt_cache_key: str | None = None
+    # httpx.Client to send requests with, e.g. get_shared_http_client() to
+    # reuse connections opened by other clients. None gives the client its own.
+    http_client: Any = field(default=None, repr=False, compare=False)
 
 
 @dataclass
@@ -38,6 +46,26 @@ class ModelResponse:
     total_time: float | None = None  # Total inference time (seconds)
 
 
+_http_client = None
+_http_client_lock = threading.Lock()
+
+
+def get_shared_http_client():
+    """
+    Get the process-wide HTTP client for model API requests.
+
+    Clients configured with it share one keep-alive connection pool, so a
+    connection opened by a startup probe is reused by the agent's first
+    request instead of paying the TCP/TLS setup again.
+    """
+    global _http_client
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = DefaultHttpxClient()
+    return _http_client
+
+
 class ModelClient:
     """
     Client for interacting with OpenAI-compatible vision-language models.
@@ -48,7 +76,25 @@ class ModelClient:
 
     def __init__(self, config: ModelConfig | None = None):
         self.config = config or ModelConfig()
-        self.client = OpenAI(base_url=self.config.base_url, api_key=self.config.api_key)
+        self.client = OpenAI(
+            base_url=self.config.base_url,
+            api_key=self.config.api_key,
+            http_client=self.config.http_client,
+        )
+
+    def warmup(self, timeout: float = 5.0) -> None:
+        """
+        Open a connection to the model server ahead of the next request.
+
+        Errors are ignored; the next real request will report them.
+
+        Args:
+            timeout: Request timeout in seconds.
+        """
+        try:
+            self.client.with_options(timeout=timeout).models.list()
+        except Exception:
+            pass
 
     def request(self, messages: list[dict[str, Any]]) -> ModelResponse:
         """
@@ -68,6 +114,10 @@ class ModelClient:
         time_to_first_token = None
         time_to_thinking_end = None
 
+        extra_body = self.config.extra_body
+        if self.config.prompt_cache_key:
+            extra_body = {"prompt_cache_key": self.config.prompt_cache_key, **extra_body}
+
         stream = self.client.chat.completions.create(
             messages=messages,
             model=self.config.model_name,
@@ -75,7 +125,7 @@ class ModelClient:
             temperature=self.config.temperature,
             top_p=self.config.top_p,
             frequency_penalty=self.config.frequency_penalty,
-            extra_body=self.config.extra_body,
+            extra_body=extra_body,
             stream=True,
         )
 
@@ -146,21 +196,21 @@ class ModelClient:
         thinking, action = self._parse_response(raw_content)
 
         # Print performance metrics
-        lang = self.config.lang
+        msgs = get_messages(self.config.lang)
         print()
         print("=" * 50)
-        print(f"⏱️  {get_message('performance_metrics', lang)}:")
+        print(f"⏱️  {msgs['performance_metrics']}:")
         print("-" * 50)
         if time_to_first_token is not None:
             print(
-                f"{get_message('time_to_first_token', lang)}: {time_to_first_token:.3f}s"
+                f"{msgs['time_to_first_token']}: {time_to_first_token:.3f}s"
             )
         if time_to_thinking_end is not None:
             print(
-                f"{get_message('time_to_thinking_end', lang)}:        {time_to_thinking_end:.3f}s"
+                f"{msgs['time_to_thinking_end']}:        {time_to_thinking_end:.3f}s"
             )
         print(
-            f"{get_message('total_inference_time', lang)}:          {total_time:.3f}s"
+            f"{msgs['total_inference_time']}:          {total_time:.3f}s"
         )
         print("=" * 50)
 
@@ -286,5 +336,13 @@ class MessageBuilder:
         Returns:
             JSON string with screen info.
         """
+        if not extra_info:
+            return _screen_info_for_app(current_app)
         info = {"current_app": current_app, **extra_info}
         return json.dumps(info, ensure_ascii=False)
+
+
+@functools.lru_cache(maxsize=64)
+def _screen_info_for_app(current_app: str) -> str:
+    """Get the screen info string for an app, with no extra info."""
+    return json.dumps({"current_app": current_app}, ensure_ascii=False)
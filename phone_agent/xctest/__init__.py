@@ -4,6 +4,7 @@ from phone_agent.xctest.connection import (
     ConnectionType,
     DeviceInfo,
     XCTestConnection,
+    get_wda_session,
     list_devices,
     quick_connect,
 )
@@ -44,4 +45,5 @@ __all__ = [
     "ConnectionType",
     "quick_connect",
     "list_devices",
+    "get_wda_session",
 ]
@@ -1,9 +1,50 @@
 """iOS device connection management via idevice tools and WebDriverAgent."""
 
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+from typing import Any
+
+try:
+    import orjson as _json
+except ImportError:  # orjson is optional; fall back to the standard library
+    import json as _json
+
+_wda_session = None
+_wda_session_lock = threading.Lock()
+
+
+def get_wda_session():
+    """
+    Get the process-wide HTTP session used for WebDriverAgent requests.
+
+    The session is created lazily and kept alive, so every WDA call reuses
+    the same pooled connection instead of opening a new one.
+
+    Raises:
+        ImportError: If the requests library is not installed.
+    """
+    global _wda_session
+    if _wda_session is None:
+        import requests
+
+        with _wda_session_lock:
+            if _wda_session is None:
+                _wda_session = requests.Session()
+    return _wda_session
+
+
+def parse_wda_json(response) -> Any:
+    """
+    Decode the JSON body of a WebDriverAgent response.
+
+    Uses orjson when it is installed, which matters for large payloads such
+    as base64 screenshots, and the standard json module otherwise.
+    """
+    return _json.loads(response.content)
 
 
 class ConnectionType(Enum):
@@ -64,6 +105,10 @@ class XCTestConnection:
         Note:
             Requires libimobiledevice to be installed.
             Install on macOS: brew install libimobiledevice
+
+            Each device's details are queried on its own thread, so listing
+            several devices takes about as long as the slowest one. Plain
+            threads also keep this usable from inside a running event loop.
         """
         try:
             # Get list of device UDIDs
@@ -73,13 +118,18 @@ class XCTestConnection:
                 text=True,
                 timeout=5,
             )
+            udids = [
+                line.strip() for line in result.stdout.strip().split("\n") if line.strip()
+            ]
+            if not udids:
+                return []
 
-            devices = []
-            for line in result.stdout.strip().split("\n"):
-                udid = line.strip()
-                if not udid:
-                    continue
+            # Get detailed device info, one ideviceinfo process per device
+            with ThreadPoolExecutor(max_workers=len(udids)) as executor:
+                details = list(executor.map(self._get_device_details, udids))
 
+            devices = []
+            for udid, device_info in zip(udids, details):
                 # Determine connection type (network devices have specific format)
                 conn_type = (
                     ConnectionType.NETWORK
@@ -87,9 +137,6 @@ class XCTestConnection:
                     else ConnectionType.USB
                 )
 
-                # Get detailed device info
-                device_info = self._get_device_details(udid)
-
                 devices.append(
                     DeviceInfo(
                         device_id=udid,
@@ -204,9 +251,7 @@ class XCTestConnection:
             True if WDA is ready, False otherwise.
         """
         try:
-            import requests
-
-            response = requests.get(
+            response = get_wda_session().get(
                 f"{self.wda_url}/status", timeout=timeout, verify=False
             )
             return response.status_code == 200
@@ -226,9 +271,7 @@ class XCTestConnection:
             Tuple of (success, session_id or error_message).
         """
         try:
-            import requests
-
-            response = requests.post(
+            response = get_wda_session().post(
                 f"{self.wda_url}/session",
                 json={"capabilities": {}},
                 timeout=30,
@@ -236,7 +279,7 @@ class XCTestConnection:
             )
 
             if response.status_code in (200, 201):
-                data = response.json()
+                data = parse_wda_json(response)
                 session_id = data.get("sessionId") or data.get("value", {}).get(
                     "sessionId"
                 )
@@ -260,12 +303,12 @@ class XCTestConnection:
             Status dictionary or None if not available.
         """
         try:
-            import requests
-
-            response = requests.get(f"{self.wda_url}/status", timeout=5, verify=False)
+            response = get_wda_session().get(
+                f"{self.wda_url}/status", timeout=5, verify=False
+            )
 
             if response.status_code == 200:
-                return response.json()
+                return parse_wda_json(response)
             return None
 
         except Exception:
@@ -5,6 +5,7 @@ import time
 from typing import Optional
 
 from phone_agent.config.apps_ios import APP_PACKAGES_IOS as APP_PACKAGES
+from phone_agent.xctest.connection import get_wda_session, parse_wda_json
 
 SCALE_FACTOR = 3 # 3 for most modern iPhone 
 
@@ -42,15 +43,13 @@ def get_current_app(
         The app name if recognized, otherwise "System Home".
     """
     try:
-        import requests
-
         # Get active app info from WDA using activeAppInfo endpoint
-        response = requests.get(
+        response = get_wda_session().get(
             f"{wda_url.rstrip('/')}/wda/activeAppInfo", timeout=5, verify=False
         )
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_wda_json(response)
             # Extract bundle ID from response
             # Response format: {"value": {"bundleId": "com.apple.AppStore", "name": "", "pid": 825, "processArguments": {...}}, "sessionId": "..."}
             value = data.get("value", {})
@@ -90,8 +89,6 @@ def tap(
         delay: Delay in seconds after tap.
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "actions")
 
         # W3C WebDriver Actions API for tap/click
@@ -111,7 +108,7 @@ def tap(
             ]
         }
 
-        requests.post(url, json=actions, timeout=15, verify=False)
+        get_wda_session().post(url, json=actions, timeout=15, verify=False)
 
         time.sleep(delay)
 
@@ -139,8 +136,6 @@ def double_tap(
         delay: Delay in seconds after double tap.
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "actions")
 
         # W3C WebDriver Actions API for double tap
@@ -164,7 +159,7 @@ def double_tap(
             ]
         }
 
-        requests.post(url, json=actions, timeout=10, verify=False)
+        get_wda_session().post(url, json=actions, timeout=10, verify=False)
 
         time.sleep(delay)
 
@@ -194,8 +189,6 @@ def long_press(
         delay: Delay in seconds after long press.
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "actions")
 
         # W3C WebDriver Actions API for long press
@@ -218,7 +211,7 @@ def long_press(
             ]
         }
 
-        requests.post(url, json=actions, timeout=int(duration + 10), verify=False)
+        get_wda_session().post(url, json=actions, timeout=int(duration + 10), verify=False)
 
         time.sleep(delay)
 
@@ -252,8 +245,6 @@ def swipe(
         delay: Delay in seconds after swipe.
     """
     try:
-        import requests
-
         if duration is None:
             # Calculate duration based on distance
             dist_sq = (start_x - end_x) ** 2 + (start_y - end_y) ** 2
@@ -271,7 +262,7 @@ def swipe(
             "duration": duration,
         }
 
-        requests.post(url, json=payload, timeout=int(duration + 10), verify=False)
+        get_wda_session().post(url, json=payload, timeout=int(duration + 10), verify=False)
 
         time.sleep(delay)
 
@@ -299,8 +290,6 @@ def back(
         by swiping from the left edge of the screen.
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "wda/dragfromtoforduration")
 
         # Swipe from left edge to simulate back gesture
@@ -312,7 +301,7 @@ def back(
             "duration": 0.3,
         }
 
-        requests.post(url, json=payload, timeout=10, verify=False)
+        get_wda_session().post(url, json=payload, timeout=10, verify=False)
 
         time.sleep(delay)
 
@@ -336,11 +325,9 @@ def home(
         delay: Delay in seconds after pressing home.
     """
     try:
-        import requests
-
         url = f"{wda_url.rstrip('/')}/wda/homescreen"
 
-        requests.post(url, timeout=10, verify=False)
+        get_wda_session().post(url, timeout=10, verify=False)
 
         time.sleep(delay)
 
@@ -372,12 +359,10 @@ def launch_app(
         return False
 
     try:
-        import requests
-
         bundle_id = APP_PACKAGES[app_name]
         url = _get_wda_session_url(wda_url, session_id, "wda/apps/launch")
 
-        response = requests.post(
+        response = get_wda_session().post(
             url, json={"bundleId": bundle_id}, timeout=10, verify=False
         )
 
@@ -406,14 +391,12 @@ def get_screen_size(
         Tuple of (width, height). Returns (375, 812) as default if unable to fetch.
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "window/size")
 
-        response = requests.get(url, timeout=5, verify=False)
+        response = get_wda_session().get(url, timeout=5, verify=False)
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_wda_json(response)
             value = data.get("value", {})
             width = value.get("width", 375)
             height = value.get("height", 812)
@@ -444,11 +427,9 @@ def press_button(
         delay: Delay in seconds after pressing.
     """
     try:
-        import requests
-
         url = f"{wda_url.rstrip('/')}/wda/pressButton"
 
-        requests.post(url, json={"name": button_name}, timeout=10, verify=False)
+        get_wda_session().post(url, json={"name": button_name}, timeout=10, verify=False)
 
         time.sleep(delay)
 
@@ -2,6 +2,8 @@
 
 import time
 
+from phone_agent.xctest.connection import get_wda_session, parse_wda_json
+
 
 def _get_wda_session_url(wda_url: str, session_id: str | None, endpoint: str) -> str:
     """
@@ -43,12 +45,10 @@ def type_text(
         Use tap() to focus on the input field first.
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "wda/keys")
 
         # Send text to WDA
-        response = requests.post(
+        response = get_wda_session().post(
             url, json={"value": list(text), "frequency": frequency}, timeout=30, verify=False
         )
 
@@ -77,21 +77,19 @@ def clear_text(
         The input field must be focused before calling this function.
     """
     try:
-        import requests
-
         # First, try to get the active element
         url = _get_wda_session_url(wda_url, session_id, "element/active")
 
-        response = requests.get(url, timeout=10, verify=False)
+        response = get_wda_session().get(url, timeout=10, verify=False)
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_wda_json(response)
             element_id = data.get("value", {}).get("ELEMENT") or data.get("value", {}).get("element-6066-11e4-a52e-4f735466cecf")
 
             if element_id:
                 # Clear the element
                 clear_url = _get_wda_session_url(wda_url, session_id, f"element/{element_id}/clear")
-                requests.post(clear_url, timeout=10, verify=False)
+                get_wda_session().post(clear_url, timeout=10, verify=False)
                 return
 
         # Fallback: send backspace commands
@@ -117,13 +115,11 @@ def _clear_with_backspace(
         max_backspaces: Maximum number of backspaces to send.
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "wda/keys")
 
         # Send backspace character multiple times
         backspace_char = "\u0008"  # Backspace Unicode character
-        requests.post(
+        get_wda_session().post(
             url,
             json={"value": [backspace_char] * max_backspaces},
             timeout=10,
@@ -152,11 +148,9 @@ def send_keys(
         >>> send_keys(["\n"])  # Send enter key
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "wda/keys")
 
-        requests.post(url, json={"value": keys}, timeout=10, verify=False)
+        get_wda_session().post(url, json={"value": keys}, timeout=10, verify=False)
 
     except ImportError:
         print("Error: requests library required. Install: pip install requests")
@@ -193,11 +187,9 @@ def hide_keyboard(
         session_id: Optional WDA session ID.
     """
     try:
-        import requests
-
         url = f"{wda_url.rstrip('/')}/wda/keyboard/dismiss"
 
-        requests.post(url, timeout=10, verify=False)
+        get_wda_session().post(url, timeout=10, verify=False)
 
     except ImportError:
         print("Error: requests library required. Install: pip install requests")
@@ -220,14 +212,12 @@ def is_keyboard_shown(
         True if keyboard is shown, False otherwise.
     """
     try:
-        import requests
-
         url = _get_wda_session_url(wda_url, session_id, "wda/keyboard/shown")
 
-        response = requests.get(url, timeout=5, verify=False)
+        response = get_wda_session().get(url, timeout=5, verify=False)
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_wda_json(response)
             return data.get("value", False)
 
     except ImportError:
@@ -254,11 +244,9 @@ def set_pasteboard(
         After setting pasteboard, you can simulate paste gesture.
     """
     try:
-        import requests
-
         url = f"{wda_url.rstrip('/')}/wda/setPasteboard"
 
-        requests.post(
+        get_wda_session().post(
             url, json={"content": text, "contentType": "plaintext"}, timeout=10, verify=False
         )
 
@@ -281,14 +269,12 @@ def get_pasteboard(
         Pasteboard content or None if failed.
     """
     try:
-        import requests
-
         url = f"{wda_url.rstrip('/')}/wda/getPasteboard"
 
-        response = requests.post(url, timeout=10, verify=False)
+        response = get_wda_session().post(url, timeout=10, verify=False)
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_wda_json(response)
             return data.get("value")
 
     except ImportError:
@@ -2,6 +2,7 @@
 
 import base64
 import os
+import struct
 import subprocess
 import tempfile
 import uuid
@@ -10,6 +11,8 @@ from io import BytesIO
 
 from PIL import Image
 
+from phone_agent.xctest.connection import get_wda_session, parse_wda_json
+
 
 @dataclass
 class Screenshot:
@@ -57,6 +60,29 @@ def get_screenshot(
     return _create_fallback_screenshot(is_sensitive=False)
 
 
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+
+def _png_size_from_base64(base64_data: str) -> tuple[int, int] | None:
+    """
+    Get the dimensions of a base64-encoded PNG without decoding the image.
+
+    The width and height live in the IHDR chunk within the first 24 bytes,
+    which are the first 32 base64 characters.
+
+    Returns:
+        (width, height), or None if the data is not a PNG.
+    """
+    try:
+        header = base64.b64decode(base64_data[:32])
+    except ValueError:
+        return None
+    if len(header) < 24 or header[:8] != _PNG_SIGNATURE or header[12:16] != b"IHDR":
+        return None
+    width, height = struct.unpack(">II", header[16:24])
+    return width, height
+
+
 def _get_screenshot_wda(
     wda_url: str, session_id: str | None, timeout: int
 ) -> Screenshot | None:
@@ -72,21 +98,22 @@ def _get_screenshot_wda(
         Screenshot object or None if failed.
     """
     try:
-        import requests
-
         url = f"{wda_url.rstrip('/')}/screenshot"
 
-        response = requests.get(url, timeout=timeout, verify=False)
+        response = get_wda_session().get(url, timeout=timeout, verify=False)
 
         if response.status_code == 200:
-            data = response.json()
+            data = parse_wda_json(response)
             base64_data = data.get("value", "")
 
             if base64_data:
-                # Decode to get dimensions
-                img_data = base64.b64decode(base64_data)
-                img = Image.open(BytesIO(img_data))
-                width, height = img.size
+                # Read dimensions from the PNG header, decoding the whole image
+                # only if the payload is not a PNG
+                size = _png_size_from_base64(base64_data)
+                if size is None:
+                    img = Image.open(BytesIO(base64.b64decode(base64_data)))
+                    size = img.size
+                width, height = size
 
                 return Screenshot(
                     base64_data=base64_data,